@@ -0,0 +1,252 @@
+import os
+import sys
+import json
+import math
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+import contextlib
+from functools import partial
+import aiohttp
+import numpy as np
+from concurrency_examples.comparisons import io_bound
+from utils import parallel
+from utils.local_api import LocalAPIServer
+from utils.parallel import parallel_map
+
+# 1. Workloads: a CPU-bound function, a simulated I/O wait and real HTTP requests (sync and async flavours)
+CPU_N = 2000  # Factorial size per item
+IO_LATENCY = 0.01  # Seconds of simulated I/O per item
+HTTP_LATENCY = 0.01  # Server-side latency of the local API for the "http" workload
+HTTP_POST_ID = 1
+
+
+def cpu_task(n):
+    return math.factorial(n).bit_length()
+
+
+def io_task(latency):
+    time.sleep(latency)
+    return latency
+
+
+async def io_task_async(latency):
+    await asyncio.sleep(latency)
+    return latency
+
+
+# "http" runs io_bound's real fetch functions against a LocalAPIServer (sockets, HTTP parsing, JSON decoding)
+WORKLOADS = {
+    "cpu": {"item": lambda: CPU_N, "sync": cpu_task, "async": None},
+    "io": {"item": lambda: IO_LATENCY, "sync": io_task, "async": io_task_async},
+    "http": {"item": lambda: HTTP_POST_ID, "sync": io_bound.fetch_post, "async": io_bound.fetch_post_async,
+             "http": True},
+}
+BACKENDS = ("serial", "thread", "process", "asyncio")
+
+
+# 2. Backends
+def _run_asyncio(func, items, workers, session=False):
+    async def main():
+        if session:  # `func(session, item)` shares one pooled aiohttp session
+            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=workers)) as client:
+                return await run(partial(func, client))
+        return await run(func)
+
+    async def run(func):
+        semaphore = asyncio.Semaphore(workers)
+
+        async def bounded(item):
+            async with semaphore:
+                return await func(item)
+
+        return await asyncio.gather(*(bounded(item) for item in items))
+
+    return asyncio.run(main())
+
+
+def run_once(workload, backend, workers, size, base_url=None):
+    """Runs one batch of `size` items and returns its wall time in seconds.
+
+    HTTP workloads need the `base_url` of a running API server.
+    """
+    spec = WORKLOADS[workload]
+    items = [spec["item"]()] * size
+    sync_func, async_func = spec["sync"], spec["async"]
+    if spec.get("http"):
+        sync_func = partial(sync_func, base_url=base_url, timeout=io_bound.TIMEOUT)
+        async_func = partial(async_func, base_url=base_url)
+    start = time.perf_counter()
+    if backend == "asyncio":
+        _run_asyncio(async_func, items, workers, session=spec.get("http", False))
+    else:
+        parallel_map(sync_func, items, backend=backend, workers=workers)
+    return time.perf_counter() - start
+
+
+def summarize(samples):
+    p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+    return {
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+        "max": max(samples),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+    }
+
+
+# 3. Runner
+HOST_TYPE_KEYS = ("machine", "system", "processor", "implementation", "python", "cpus")
+
+
+def host_info():
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "processor": platform.processor(),
+        "implementation": platform.python_implementation(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def case_key(case):
+    return f"{case['workload']}/{case['backend']}/w{case['workers']}/n{case['size']}"
+
+
+def run_benchmarks(workloads=("cpu", "io"), backends=BACKENDS, workers=(1, 2, 4), sizes=(50,), repeats=5,
+                   warmup=1):
+    """Runs every workload × backend × workers × size case and returns a JSON-serializable report.
+
+    Each case runs `warmup` untimed batches first (which also start the warm
+    pools) and then `repeats` timed ones. Serial runs once per size, and
+    asyncio only runs I/O workloads. HTTP workloads share one `LocalAPIServer`
+    started for the whole run.
+    """
+    needs_server = any(WORKLOADS[workload].get("http") for workload in workloads)
+    server = LocalAPIServer(latency=HTTP_LATENCY, seed=0) if needs_server else contextlib.nullcontext()
+    cases = []
+    with server:
+        base_url = server.base_url if needs_server else None
+        for workload in workloads:
+            for backend in backends:
+                if backend == "asyncio" and WORKLOADS[workload]["async"] is None:
+                    continue
+                for worker_count in ([1] if backend == "serial" else workers):
+                    for size in sizes:
+                        for _ in range(warmup):
+                            run_once(workload, backend, worker_count, size, base_url)
+                        samples = [run_once(workload, backend, worker_count, size, base_url) for _ in range(repeats)]
+                        case = {"workload": workload, "backend": backend, "workers": worker_count, "size": size}
+                        case.update(summarize(samples), throughput=size / statistics.fmean(samples), samples=samples)
+                        cases.append(case)
+                    parallel.shutdown()  # Don't keep a pool per swept worker count alive
+    return {"host": host_info(), "created": time.time(), "repeats": repeats, "warmup": warmup, "cases": cases}
+
+
+def best_settings(report):
+    """Fastest backend/workers (by p50) for each workload and size."""
+    best = {}
+    for case in report["cases"]:
+        key = (case["workload"], case["size"])
+        if key not in best or case["p50"] < best[key]["p50"]:
+            best[key] = case
+    return list(best.values())
+
+
+# 4. Regression check
+def compare(baseline, current, threshold=0.10, metric="p50"):
+    """Returns cases whose `metric` got slower than the baseline by more than `threshold` (a fraction)."""
+    baseline_cases = {case_key(case): case for case in baseline["cases"]}
+    regressions = []
+    for case in current["cases"]:
+        key = case_key(case)
+        if key not in baseline_cases:
+            continue
+        before, after = baseline_cases[key][metric], case[metric]
+        change = (after - before) / before if before else 0.0
+        if change > threshold:
+            regressions.append({"case": key, "baseline": before, "current": after, "change": change})
+    return regressions
+
+
+def host_differences(baseline, current):
+    """Returns `(key, baseline, current)` for host properties that differ (the node name is ignored).
+
+    Timings from a different machine type, OS, CPU count or Python are not
+    comparable, so `compare` results should not be trusted when this is non-empty.
+    """
+    before, after = baseline.get("host", {}), current.get("host", {})
+    return [(key, before.get(key), after.get(key)) for key in HOST_TYPE_KEYS if before.get(key) != after.get(key)]
+
+
+def format_table(report):
+    header = f"{'case':<28} {'mean':>9} {'stdev':>9} {'min':>9} {'p50':>9} {'p90':>9} {'items/s':>10}"
+    lines = [header]
+    for case in report["cases"]:
+        lines.append(
+            f"{case_key(case):<28} {case['mean'] * 1000:>9.2f} {case['stdev'] * 1000:>9.2f} "
+            f"{case['min'] * 1000:>9.2f} {case['p50'] * 1000:>9.2f} {case['p90'] * 1000:>9.2f} "
+            f"{case['throughput']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+# 5. CLI
+def _int_list(value):
+    return [int(part) for part in value.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CPU / I/O concurrency benchmarks (times in ms).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks and write a JSON report")
+    run_parser.add_argument("--workloads", default="cpu,io", help="Comma-separated: cpu, io, http")
+    run_parser.add_argument("--backends", default=",".join(BACKENDS))
+    run_parser.add_argument("--workers", type=_int_list, default=[1, 2, 4])
+    run_parser.add_argument("--sizes", type=_int_list, default=[50])
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--output", default="benchmark.json")
+
+    compare_parser = commands.add_parser("compare", help="Flag regressions of a report against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown, e.g. 0.1 = 10%%")
+    compare_parser.add_argument("--metric", default="p50", choices=["mean", "min", "p50", "p90", "p99"])
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run_benchmarks(args.workloads.split(","), args.backends.split(","), args.workers, args.sizes,
+                                args.repeats, args.warmup)
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(format_table(report))
+        for case in best_settings(report):
+            print(f"Best for {case['workload']} n={case['size']}: {case['backend']} with {case['workers']} workers")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+    for key, before, after in host_differences(baseline, current):
+        print(f"WARNING host mismatch, timings may not be comparable: {key} {before!r} -> {after!r}")
+    regressions = compare(baseline, current, args.threshold, args.metric)
+    for regression in regressions:
+        print(f"REGRESSION {regression['case']}: {regression['baseline'] * 1000:.2f} ms -> "
+              f"{regression['current'] * 1000:.2f} ms ({regression['change']:+.1%})")
+    if not regressions:
+        print("No regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,8 @@
-import threading
-import multiprocessing
 import math
+import operator
 from utils.decorators import time_it
+from utils.metrics import registry
+from utils.parallel import parallel_map, parallel_map_reduce
 
 
 # 2. CPU-Bound Computation
@@ -19,35 +20,29 @@ def run_single_thread(numbers):
 # 4. Multithreading Execution (Ineffective due to GIL)
 @time_it
 def run_multithreading(numbers):
-    threads = []
-    results = []
-
-    def worker(n):
-        results.append(compute_factorial(n))
-
-    for num in numbers:
-        thread = threading.Thread(target=worker, args=(num,))
-        threads.append(thread)
-        thread.start()
-
-    for thread in threads:
-        thread.join()
-
-    return results
+    return parallel_map(compute_factorial, numbers, backend="thread")
 
 
 # 5. Multiprocessing Execution (Effective for CPU-bound tasks)
 @time_it
 def run_multiprocessing(numbers):
-    with multiprocessing.Pool(processes=multiprocessing.cpu_count()) as pool:
-        results = pool.map(compute_factorial, numbers)
-    return results
+    # The pool is created on the first call and kept warm for the next ones
+    return parallel_map(compute_factorial, numbers, backend="process")
+
+
+# 6. Map-Reduce Execution (each worker sums its chunk, so only a few results are pickled back)
+@time_it
+def run_map_reduce(numbers):
+    return parallel_map_reduce(compute_factorial, numbers, operator.add, backend="process")
 
 
-# 6. Execution
+# 7. Execution
 if __name__ == "__main__":
     test_numbers = [50000] * 100  # Large numbers for CPU-intensive calculations
     print("=== CPU-BOUND TASKS ===")
     run_single_thread(test_numbers)
     run_multithreading(test_numbers)
     run_multiprocessing(test_numbers)
+    run_multiprocessing(test_numbers)  # Warm pool: no process startup this time
+    run_map_reduce(test_numbers)
+    print(registry.to_table())
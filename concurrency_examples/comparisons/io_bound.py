@@ -1,85 +1,102 @@
-import threading
+import argparse
 import multiprocessing
 import asyncio
+from functools import partial
 import requests
 import aiohttp
-from utils.decorators import time_it
+from utils.decorators import time_it, retry
+from utils.fetch_engine import FetchEngine
+from utils.general import API_BASE_URL
+from utils.local_api import LocalAPIServer
+from utils.metrics import registry
 
 # 2. API Setup
-API_URL = "https://jsonplaceholder.typicode.com/posts/{}"
 POST_IDS = list(range(1, 51))  # Fetch 50 posts
+CONCURRENCY = 32  # Requests in flight at once, however many ids there are
+TIMEOUT = 10.0  # Seconds per request
+
+
+def post_url(post_id, base_url=API_BASE_URL):
+    return f"{base_url}/posts/{post_id}"
 
 
 # 3. Synchronous (Single-threaded) Requests
-def fetch_post(post_id):
+def fetch_post(post_id, base_url=API_BASE_URL, timeout=None):
     """Fetch a post from the API (blocking request)."""
-    response = requests.get(API_URL.format(post_id))
+    response = requests.get(post_url(post_id, base_url), timeout=timeout)
+    response.raise_for_status()  # A 429/500 error body is not a post
     return response.json()
 
 
 @time_it
-def run_single_thread():
+def run_single_thread(base_url=API_BASE_URL):
     """Fetch posts synchronously (one at a time)."""
-    return [fetch_post(post_id) for post_id in POST_IDS]
+    return [fetch_post(post_id, base_url) for post_id in POST_IDS]
 
 
 # 4. Multithreading for Concurrent Requests
 @time_it
-def run_multithreading():
-    """Fetch posts using multiple threads."""
-    threads = []
-    results = []
-
-    def worker(post_id):
-        results.append(fetch_post(post_id))
-
-    for _post_id in POST_IDS:
-        thread = threading.Thread(target=worker, args=(_post_id,))
-        threads.append(thread)
-        thread.start()
-
-    for thread in threads:
-        thread.join()
-
+def run_multithreading(base_url=API_BASE_URL, post_ids=POST_IDS):
+    """Fetch posts on a fixed-size thread pool, in id order (scales to 100k+ ids)."""
+    engine = FetchEngine(concurrency=CONCURRENCY, timeout=TIMEOUT, ordered=True)
+    results = [result.value for result in engine.stream(partial(fetch_post, base_url=base_url), post_ids)]
+    print(f"Threads: {engine.stats}")
     return results
 
 
 # 5. Multiprocessing (Not Ideal for I/O)
 @time_it
-def run_multiprocessing():
+def run_multiprocessing(base_url=API_BASE_URL):
     """Fetch posts using multiple processes."""
     with multiprocessing.Pool(processes=8) as pool:  # 8 parallel processes
-        results = pool.map(fetch_post, POST_IDS)
+        results = pool.map(partial(fetch_post, base_url=base_url), POST_IDS)
     return results
 
 
 # 6. AsyncIO + AIOHTTP (Best for High-Concurrency I/O)
-async def fetch_post_async(session, post_id):
+@retry(max_attempts=3, delay=0.5, backoff=2, jitter=True, exceptions=(aiohttp.ClientError, asyncio.TimeoutError),
+       reraise=True)
+async def fetch_post_async(session, post_id, base_url=API_BASE_URL):
     """Async function to fetch a post using aiohttp (disabling SSL verification)."""
-    async with session.get(API_URL.format(post_id), ssl=False) as response:
+    async with session.get(post_url(post_id, base_url), ssl=False) as response:
+        response.raise_for_status()  # Raises aiohttp.ClientResponseError, so 429/500 are retried
         return await response.json()
 
 
 @time_it
-def run_asyncio():
-    """Fetch posts using asyncio."""
+def run_asyncio(base_url=API_BASE_URL, post_ids=POST_IDS):
+    """Fetch posts using asyncio, at most CONCURRENCY at a time, in id order."""
+    engine = FetchEngine(concurrency=CONCURRENCY, timeout=TIMEOUT, ordered=True)
 
     async def main():
-        async with aiohttp.ClientSession() as session:
-            tasks = [fetch_post_async(session, post_id) for post_id in POST_IDS]
-            return await asyncio.gather(*tasks)
+        connector = aiohttp.TCPConnector(limit=CONCURRENCY)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            fetch = partial(fetch_post_async, session, base_url=base_url)
+            return [result.value async for result in engine.astream(fetch, post_ids)]
 
-    return asyncio.run(main())
+    results = asyncio.run(main())
+    print(f"Asyncio: {engine.stats}")
+    return results
 
 
-def execute():
+def execute(base_url=API_BASE_URL):
     print("=== API REQUESTS BENCHMARK ===")
-    run_single_thread()
-    run_multithreading()
-    run_multiprocessing()
-    run_asyncio()
+    run_single_thread(base_url)
+    run_multithreading(base_url)
+    run_multiprocessing(base_url)
+    run_asyncio(base_url)
+    print(registry.to_table())
 
 
 # 7. Execution
 if __name__ == "__main__":
-    execute()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default=API_BASE_URL)
+    parser.add_argument("--local", action="store_true", help="Use a local server with 50 ms simulated latency")
+    args = parser.parse_args()
+
+    if args.local:
+        with LocalAPIServer(latency=0.05, latency_distribution="lognormal", seed=0) as server:
+            execute(server.base_url)
+    else:
+        execute(args.base_url)
@@ -0,0 +1,84 @@
+import json
+import pytest
+from concurrency_examples.comparisons import benchmark
+
+
+@pytest.fixture
+def report(monkeypatch):
+    monkeypatch.setattr(benchmark, "IO_LATENCY", 0.001)
+    return benchmark.run_benchmarks(["io"], ["serial", "thread", "asyncio"], workers=[2], sizes=[4], repeats=3)
+
+
+def test_report_covers_every_case(report):
+    keys = [benchmark.case_key(case) for case in report["cases"]]
+
+    assert keys == ["io/serial/w1/n4", "io/thread/w2/n4", "io/asyncio/w2/n4"]
+    for case in report["cases"]:
+        assert len(case["samples"]) == 3
+        assert case["min"] <= case["p50"] <= case["max"]
+    json.dumps(report)  # Serializable as-is
+
+
+def test_compare_flags_only_slower_cases(report):
+    slower = json.loads(json.dumps(report))
+    slower["cases"][1]["p50"] *= 1.5
+    slower["cases"][2]["p50"] *= 1.05
+
+    regressions = benchmark.compare(report, slower, threshold=0.10)
+
+    assert [regression["case"] for regression in regressions] == ["io/thread/w2/n4"]
+    assert regressions[0]["change"] == pytest.approx(0.5)
+
+
+def test_compare_cli_exit_code(report, tmp_path):
+    slower = json.loads(json.dumps(report))
+    for case in slower["cases"]:
+        case["p50"] *= 2
+    (tmp_path / "baseline.json").write_text(json.dumps(report))
+    (tmp_path / "current.json").write_text(json.dumps(slower))
+
+    assert benchmark.main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "baseline.json")]) == 0
+    assert benchmark.main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "current.json")]) == 1
+
+
+def test_http_workload_fetches_from_local_server(monkeypatch):
+    """Test that the http workload runs the real io_bound fetchers on every backend."""
+    monkeypatch.setattr(benchmark, "HTTP_LATENCY", 0.0)
+    fetched = []
+    original = benchmark.io_bound.fetch_post
+
+    def counting_fetch(post_id, base_url, timeout=None):
+        fetched.append(base_url)
+        return original(post_id, base_url, timeout=timeout)
+
+    monkeypatch.setitem(benchmark.WORKLOADS["http"], "sync", counting_fetch)
+
+    report = benchmark.run_benchmarks(["http"], ["serial", "thread", "asyncio"], workers=[2], sizes=[3], repeats=1,
+                                      warmup=0)
+
+    assert [benchmark.case_key(case) for case in report["cases"]] == [
+        "http/serial/w1/n3", "http/thread/w2/n3", "http/asyncio/w2/n3",
+    ]
+    assert len(fetched) == 6 and fetched[0].startswith("http://127.0.0.1:")
+
+
+def test_host_differences_ignore_node_name(report):
+    other_node = json.loads(json.dumps(report))
+    other_node["host"]["node"] = "another-runner"
+    other_type = json.loads(json.dumps(report))
+    other_type["host"]["cpus"] = (report["host"]["cpus"] or 1) * 2
+
+    assert benchmark.host_differences(report, other_node) == []
+    assert benchmark.host_differences(report, other_type) == [
+        ("cpus", report["host"]["cpus"], other_type["host"]["cpus"]),
+    ]
+
+
+def test_compare_cli_warns_on_host_mismatch(report, tmp_path, capsys):
+    other_host = json.loads(json.dumps(report))
+    other_host["host"]["machine"] = "other-arch"
+    (tmp_path / "baseline.json").write_text(json.dumps(report))
+    (tmp_path / "current.json").write_text(json.dumps(other_host))
+
+    assert benchmark.main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "current.json")]) == 0
+    assert "WARNING host mismatch" in capsys.readouterr().out
@@ -1,7 +1,21 @@
 import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from dependency_injection.api_client import AsyncAPIClient
+from dependency_injection.data_handler import AsyncDataHandler
 
-app = FastAPI()
+api_client = AsyncAPIClient(pool_size=100, timeout=5)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    await api_client.start()  # One pooled session for the whole service
+    yield
+    await api_client.close()
+
+
+app = FastAPI(lifespan=lifespan)
+data_handler = AsyncDataHandler(api_client=api_client)
 
 
 @app.get('/')
@@ -9,5 +23,10 @@ async def read_root() -> dict:
     await asyncio.sleep(1)  # Simulating a delay
     return {'Hello': 'World'}
 
+
+@app.get('/posts')
+async def read_posts(limit: int = 5, keyword: str = None) -> list:
+    return await data_handler.get_top_posts(limit=limit, keyword=keyword)  # No thread hop needed
+
 # uvicorn use_async:app --reload
 # wrk -t12 -c400 -d15s http://127.0.0.1:8000/
@@ -0,0 +1,9 @@
+import pytest
+from utils.local_api import LocalAPIServer
+
+
+@pytest.fixture(scope="session")
+def local_api():
+    """Local stand-in for the posts API on an ephemeral port (no latency or injected failures)."""
+    with LocalAPIServer(seed=0) as server:
+        yield server
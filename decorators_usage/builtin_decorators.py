@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from functools import lru_cache
 from dataclasses import dataclass
 from utils.decorators import time_it
+from utils.metrics import registry
 import time
 
 
@@ -84,6 +85,7 @@ def main():
 
     print(rect.expensive_calculation(2))  # ✅ Uses @lru_cache
     print(rect.expensive_calculation(2))  # 🔥 Cached result (no recomputation)
+    print(registry.to_table())  # ⏱️ Timings recorded by @time_it
 
 
 # 🎯 **Testing the Built-in Decorators**
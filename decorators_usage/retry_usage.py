@@ -1,5 +1,6 @@
 import random
-from utils.decorators import retry
+import asyncio
+from utils.decorators import retry, CircuitBreaker, RetryBudget
 
 
 # Example Usage
@@ -10,5 +11,20 @@ def unstable_function():
     return "Success!"
 
 
+# Exponential backoff with full jitter, shared retry budget and circuit breaker
+breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+budget = RetryBudget(max_retries=20, per_seconds=60)
+
+
+@retry(max_attempts=5, delay=0.5, backoff=2, max_delay=8, jitter=True,
+       exceptions=(ValueError,), budget=budget, circuit_breaker=breaker)
+async def unstable_coroutine():
+    await asyncio.sleep(0.1)  # Simulating I/O, other tasks keep running while we back off
+    if random.random() < 0.7:
+        raise ValueError("Random failure")
+    return "Async success!"
+
+
 if __name__ == '__main__':
     print(unstable_function())
+    print(asyncio.run(unstable_coroutine()))
@@ -1,21 +1,21 @@
-from utils.decorators import save_to_dict
+import time
+from utils.decorators import ttl_cache
 
 
 # Example Usage
-cache = {}
-
-@save_to_dict(cache)
+@ttl_cache(maxsize=1000, ttl=60)
 def fetch_data(key):
-    """Simulates fetching data (output must be a dictionary)."""
+    """Simulates a slow lookup (cached for 60 seconds, at most 1000 keys)."""
+    time.sleep(1)
     return {"data": f"Value for {key}"}
 
 
-
 def main():
-    fetch_data("user1")
-    fetch_data("user2")
-    print(cache)
+    fetch_data("user1")  # Miss: takes a second
+    fetch_data("user2")  # Miss: takes a second
+    print(fetch_data("user1"))  # Hit: returned instantly
+    print(fetch_data.cache_info())
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
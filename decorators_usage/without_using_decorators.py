@@ -36,7 +36,7 @@ def retry_unstable_function(max_attempts=5, delay=2):
     return None
 
 
-# 3️⃣ Caching Function Output (Previously @save_to_dict)
+# 3️⃣ Caching Function Output (plain-dict equivalent of the old @save_to_dict)
 cache = {}
 
 
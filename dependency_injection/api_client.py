@@ -1,18 +1,82 @@
+import asyncio
+import aiohttp
 import requests
+from dependency_injection.http_cache import ResponseCache
+from utils.general import API_BASE_URL
 
 
 class APIClient:
     """Uses dependency injection by passing the HTTP client."""
 
-    def __init__(self, url: str = 'https://jsonplaceholder.typicode.com/posts'):
+    def __init__(self, url: str = f'{API_BASE_URL}/posts', cache: ResponseCache = None):
         self.url = url
         self.session = requests.Session()
+        self.cache = cache  # Optional conditional-request cache
 
     def fetch_data(self):
         try:
-            response = self.session.get(self.url)
-            response.raise_for_status()  # Raise an error for 4xx/5xx responses
-            return response.json()
+            if self.cache is None:
+                response = self.session.get(self.url)
+                response.raise_for_status()  # Raise an error for 4xx/5xx responses
+                return response.json()
+
+            response = self.session.get(self.url, headers=self.cache.conditional_headers(self.url))
+            if response.status_code == 304:
+                cached = self.cache.load(self.url)
+                if cached is not None:
+                    return cached  # Unchanged: no download, no JSON parsing
+                response = self.session.get(self.url)  # Entry was evicted meanwhile
+
+            response.raise_for_status()
+            data = response.json()
+            self.cache.store(self.url, response.headers, data)
+            return data
         except requests.RequestException as e:
             print(f"Error fetching data: {e}")
             return []
+
+
+class AsyncAPIClient:
+    """Async counterpart of APIClient, backed by a size-limited aiohttp connection pool.
+
+    Pass a shared `session` to pool connections across clients; otherwise the
+    client owns its session, created on `start()` (or first use) and closed on
+    `close()`. Also usable as `async with AsyncAPIClient() as client: ...`.
+    """
+
+    def __init__(self, url: str = f'{API_BASE_URL}/posts', pool_size: int = 100,
+                 timeout: float = 10.0, session: aiohttp.ClientSession = None):
+        self.url = url
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session = session
+        self._owns_session = session is None
+
+    async def start(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size), timeout=self.timeout
+            )
+
+    async def close(self):
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def fetch_data(self, timeout: float = None):
+        await self.start()
+        request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else self.timeout
+        try:
+            async with self.session.get(self.url, timeout=request_timeout) as response:
+                response.raise_for_status()  # Raise an error for 4xx/5xx responses
+                return await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching data: {e}")
+            return []
@@ -1,14 +1,50 @@
-from dependency_injection.api_client import APIClient
+from dependency_injection.api_client import APIClient, AsyncAPIClient
+from dependency_injection.title_index import TitleIndex
+from utils.general import API_BASE_URL
 
 
-class DataHandler:
-    """Uses dependency injection by passing the API client."""
+class _BaseDataHandler:
+    """Post storage, title index and selection shared by the sync and async handlers.
 
-    def __init__(self, api_client: APIClient):
+    Subclasses supply `refresh` and `get_top_posts` (plain or coroutine
+    methods) on top of these helpers.
+    """
+
+    def __init__(self, api_client, use_index: bool = False):
         self.api_client = api_client
+        self.use_index = use_index
+        self.posts = []
+        self.index = TitleIndex() if use_index else None
+        self._loaded = False
 
-    def get_top_posts(self, limit: int = 10, word_limit: int = 5, keyword: str = None):
-        posts = self.api_client.fetch_data()
+    def _update_posts(self, posts):
+        if not posts:
+            return  # A failed fetch (the client returns []) keeps what we have and retries next time
+        known = len(self.posts)
+        if posts[:known] == self.posts:
+            self.add_posts(posts[known:])
+        else:
+            self.posts = []
+            if self.index is not None:
+                self.index.clear()
+            self.add_posts(posts)
+        self._loaded = True
+
+    def add_posts(self, posts):
+        """Appends posts that arrived through another channel and indexes them (if indexing is on)."""
+        self.posts.extend(posts)
+        if self.index is not None:
+            self.index.add(post["title"] for post in posts)
+
+    def index_memory_bytes(self) -> int:
+        return self.index.memory_bytes() if self.index is not None else 0
+
+    def _query_index(self, limit, word_limit, keyword):
+        positions = self.index.search(keyword) if keyword else range(len(self.posts))
+        return [self._format_post(self.posts[i], word_limit) for i in positions[:limit]]
+
+    @classmethod
+    def _select_posts(cls, posts, limit, word_limit, keyword):
         structured_output = []
         count = 0
 
@@ -19,23 +55,73 @@ class DataHandler:
             if keyword and keyword.lower() not in post["title"].lower():
                 continue  # Skip posts that do not contain the keyword
 
-            output = {
-                "title": post["title"],
-                "body": ' '.join(post["body"].split(' ')[0:word_limit])
-            }
-            structured_output.append(output)
+            structured_output.append(cls._format_post(post, word_limit))
             count += 1
 
         return structured_output
 
+    @staticmethod
+    def _format_post(post, word_limit):
+        return {
+            "title": post["title"],
+            "body": ' '.join(post["body"].split(' ')[0:word_limit])
+        }
+
+
+class DataHandler(_BaseDataHandler):
+    """Uses dependency injection by passing the API client.
+
+    With `use_index=True` the posts are fetched once (see `refresh`) and keyword
+    queries are answered from a title index instead of scanning every post.
+    """
+
+    def __init__(self, api_client: APIClient, use_index: bool = False):
+        super().__init__(api_client, use_index=use_index)
+
+    def refresh(self):
+        """Fetches posts and indexes only the new ones (rebuilding if earlier posts changed)."""
+        self._update_posts(self.api_client.fetch_data())
+
+    def get_top_posts(self, limit: int = 10, word_limit: int = 5, keyword: str = None):
+        if self.use_index:
+            if not self._loaded:
+                self.refresh()
+            return self._query_index(limit, word_limit, keyword)
+
+        return self._select_posts(self.api_client.fetch_data(), limit, word_limit, keyword)
+
+
+class AsyncDataHandler(_BaseDataHandler):
+    """Async counterpart of DataHandler: same injection seam, with an awaitable API client."""
+
+    def __init__(self, api_client: AsyncAPIClient, use_index: bool = False):
+        super().__init__(api_client, use_index=use_index)
+
+    async def refresh(self):
+        """Fetches posts and indexes only the new ones (rebuilding if earlier posts changed)."""
+        self._update_posts(await self.api_client.fetch_data())
+
+    async def get_top_posts(self, limit: int = 10, word_limit: int = 5, keyword: str = None):
+        if self.use_index:
+            if not self._loaded:
+                await self.refresh()
+            return self._query_index(limit, word_limit, keyword)
+
+        return self._select_posts(await self.api_client.fetch_data(), limit, word_limit, keyword)
 
 
 def main():
-    api_client = APIClient(url='https://jsonplaceholder.typicode.com/posts')
+    api_client = APIClient(url=f'{API_BASE_URL}/posts')
     data_handler = DataHandler(api_client=api_client)
     top_posts = data_handler.get_top_posts(limit=5)
     print(top_posts)
 
+    # Fetch and index once, then answer many keyword queries from the index
+    indexed_handler = DataHandler(api_client=api_client, use_index=True)
+    for keyword in ["qui", "dolor", "est"]:
+        print(keyword, indexed_handler.get_top_posts(limit=2, keyword=keyword))
+    print(f"Index size: {indexed_handler.index_memory_bytes()} bytes")
+
 
 if __name__ == '__main__':
     main()
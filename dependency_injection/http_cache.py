@@ -0,0 +1,72 @@
+import os
+import pickle
+import hashlib
+from utils.disk_cache import CacheStats, DiskLRU
+
+
+class ResponseCache:
+    """On-disk cache of decoded JSON responses, keyed by URL and revalidated with ETag / Last-Modified.
+
+    Each entry is one file holding two pickles: the validators, then the
+    payload. Building the conditional headers only unpickles the first one,
+    and a 304 unpickles the payload instead of re-downloading and re-parsing
+    JSON. Least recently used entries are evicted once `max_bytes` is exceeded.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 64 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._store = DiskLRU([cache_dir], max_bytes, suffix=".cache")
+
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode()).hexdigest() + ".cache")
+
+    def conditional_headers(self, url: str) -> dict:
+        """Returns `If-None-Match` / `If-Modified-Since` headers for a cached URL (empty if not cached)."""
+        try:
+            with open(self._path(url), "rb") as file:
+                validators = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return {}
+
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def load(self, url: str):
+        """Returns the cached payload after a 304, or None if the entry is gone."""
+        path = self._path(url)
+        try:
+            with open(path, "rb") as file:
+                pickle.load(file)  # Skip the validators
+                payload = pickle.load(file)
+            self._store.touch(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        self._store.record_hit()
+        return payload
+
+    def store(self, url: str, headers, payload):
+        """Records a miss and caches a 200 response if it carries a validator; returns True if stored."""
+        self._store.record_miss()
+
+        validators = {"etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified")}
+        if not any(validators.values()):
+            return False  # Nothing to revalidate with
+
+        # Validators first, so `conditional_headers` never unpickles the payload
+        data = (pickle.dumps(validators, protocol=pickle.HIGHEST_PROTOCOL)
+                + pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+        self._store.write(self._path(url), data)
+        self._store.evict()
+        return True
+
+    def clear(self):
+        self._store.clear()
+
+    def stats(self) -> CacheStats:
+        return self._store.stats()
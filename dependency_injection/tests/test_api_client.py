@@ -0,0 +1,77 @@
+import pytest
+from unittest.mock import MagicMock
+from dependency_injection.api_client import APIClient
+from dependency_injection.http_cache import ResponseCache
+
+POSTS = [{"title": "Post One", "body": "Body one"}, {"title": "Post Two", "body": "Body two"}]
+
+
+def make_response(status_code=200, payload=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def cached_client(tmp_path):
+    """Creates an APIClient with an on-disk cache and a mocked session."""
+    client = APIClient(url="https://example.com/posts", cache=ResponseCache(str(tmp_path)))
+    client.session = MagicMock()
+    return client
+
+
+def test_fetch_data_serves_304_from_cache(cached_client):
+    """Test that a 304 response returns the cached payload without parsing JSON."""
+    first = make_response(payload=POSTS, headers={"ETag": '"v1"'})
+    not_modified = make_response(status_code=304)
+    cached_client.session.get.side_effect = [first, not_modified]
+
+    assert cached_client.fetch_data() == POSTS
+    assert cached_client.fetch_data() == POSTS
+
+    second_call = cached_client.session.get.call_args_list[1]
+    assert second_call.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    not_modified.json.assert_not_called()
+    assert cached_client.cache.stats().hits == 1
+    assert cached_client.cache.stats().misses == 1
+
+
+def test_fetch_data_refreshes_changed_response(cached_client):
+    """Test that a 200 after revalidation replaces the cached entry."""
+    updated = POSTS[:1]
+    cached_client.session.get.side_effect = [
+        make_response(payload=POSTS, headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        make_response(payload=updated, headers={"ETag": '"v2"'}),
+        make_response(status_code=304),
+    ]
+
+    assert cached_client.fetch_data() == POSTS
+    assert cached_client.fetch_data() == updated
+    assert cached_client.fetch_data() == updated
+
+    assert cached_client.session.get.call_args_list[1].kwargs["headers"] == {
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+    }
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test that the cache stays under its size bound."""
+    cache = ResponseCache(str(tmp_path), max_bytes=1500)
+    for i in range(5):
+        cache.store(f"https://example.com/{i}", {"ETag": str(i)}, ["x" * 500])
+
+    stats = cache.stats()
+    assert stats.currsize_bytes <= 1500
+    assert stats.evictions > 0
+    assert cache.load("https://example.com/4") == ["x" * 500]
+
+
+def test_fetch_data_without_cache():
+    """Test that the client still works without a cache."""
+    client = APIClient(url="https://example.com/posts")
+    client.session = MagicMock()
+    client.session.get.return_value = make_response(payload=POSTS)
+
+    assert client.fetch_data() == POSTS
@@ -0,0 +1,86 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from dependency_injection.api_client import AsyncAPIClient
+from dependency_injection.data_handler import AsyncDataHandler, DataHandler
+
+
+@pytest.fixture
+def mock_async_api_client():
+    """Creates a mock for AsyncAPIClient (fetch_data becomes an AsyncMock)."""
+    mock_client = MagicMock(spec=AsyncAPIClient)
+
+    mock_client.fetch_data.return_value = [
+        {"title": "Post One", "body": "This is the body of post one with many words."},
+        {"title": "Post Two", "body": "Another post body that has a different length."},
+        {"title": "Special Keyword", "body": "Keyword-specific post that should be tested."},
+    ]
+    return mock_client
+
+
+def test_get_top_posts(mock_async_api_client):
+    """Test that get_top_posts returns the expected number of posts."""
+    handler = AsyncDataHandler(mock_async_api_client)
+    posts = asyncio.run(handler.get_top_posts(limit=2, word_limit=3))
+
+    assert len(posts) == 2
+    assert posts[0] == {"title": "Post One", "body": "This is the"}
+    assert posts[1] == {"title": "Post Two", "body": "Another post body"}
+    mock_async_api_client.fetch_data.assert_awaited_once()
+
+
+def test_get_top_posts_with_keyword_indexed(mock_async_api_client):
+    """Test keyword filtering in the indexed mode, which fetches only once."""
+    handler = AsyncDataHandler(mock_async_api_client, use_index=True)
+
+    async def query():
+        first = await handler.get_top_posts(limit=5, word_limit=4, keyword="keyword")
+        second = await handler.get_top_posts(limit=5, keyword="post")
+        return first, second
+
+    first, second = asyncio.run(query())
+
+    assert first == [{"title": "Special Keyword", "body": "Keyword-specific post that should"}]
+    assert [post["title"] for post in second] == ["Post One", "Post Two"]
+    assert mock_async_api_client.fetch_data.await_count == 1
+
+
+def test_get_top_posts_empty_response():
+    """Test the case where the API returns an empty list."""
+    mock_client = MagicMock(spec=AsyncAPIClient)
+    mock_client.fetch_data.return_value = []
+
+    handler = AsyncDataHandler(mock_client)
+
+    assert asyncio.run(handler.get_top_posts()) == []
+
+
+def test_client_lifecycle():
+    """Test that the client creates its pool on start and releases it on close."""
+
+    async def lifecycle():
+        async with AsyncAPIClient(pool_size=5) as client:
+            assert client.session.connector.limit == 5
+            session = client.session
+        return client, session
+
+    client, session = asyncio.run(lifecycle())
+
+    assert client.session is None
+    assert session.closed
+
+
+def test_refresh_is_awaitable_and_indexes_new_posts(mock_async_api_client):
+    """Test that the async handler's refresh is a coroutine and the indexed path picks up new posts."""
+    handler = AsyncDataHandler(mock_async_api_client, use_index=True)
+
+    async def query():
+        await handler.get_top_posts(keyword="fresh")
+        mock_async_api_client.fetch_data.return_value = mock_async_api_client.fetch_data.return_value + [
+            {"title": "Fresh Post", "body": "Arrived after the first fetch."},
+        ]
+        await handler.refresh()
+        return await handler.get_top_posts(keyword="fresh")
+
+    assert [post["title"] for post in asyncio.run(query())] == ["Fresh Post"]
+    assert not isinstance(handler, DataHandler)
@@ -68,3 +68,71 @@ def test_get_top_posts_network_failure():
     posts = handler.get_top_posts(limit=5)
 
     assert posts == []  # Should return an empty list
+
+
+@pytest.mark.parametrize("keyword", [None, "post", "keyword", "o", "ONE", "missing"])
+def test_indexed_matches_scan(mock_api_client, keyword):
+    """Test that the indexed mode returns the same posts, in the same order, as the scan."""
+    scan = DataHandler(mock_api_client).get_top_posts(limit=2, word_limit=3, keyword=keyword)
+    indexed = DataHandler(mock_api_client, use_index=True).get_top_posts(limit=2, word_limit=3, keyword=keyword)
+
+    assert indexed == scan
+
+
+def test_indexed_fetches_once(mock_api_client):
+    """Test that repeated indexed queries reuse the fetched posts."""
+    handler = DataHandler(mock_api_client, use_index=True)
+    handler.get_top_posts(keyword="post")
+    handler.get_top_posts(keyword="special")
+
+    assert mock_api_client.fetch_data.call_count == 1
+    assert handler.index_memory_bytes() > 0
+
+
+def test_indexed_refresh_adds_new_posts(mock_api_client):
+    """Test that refresh() indexes posts that arrived since the last fetch."""
+    handler = DataHandler(mock_api_client, use_index=True)
+    assert handler.get_top_posts(keyword="fresh") == []
+
+    mock_api_client.fetch_data.return_value = mock_api_client.fetch_data.return_value + [
+        {"title": "Fresh Post", "body": "Arrived after the first fetch."},
+    ]
+    handler.refresh()
+
+    posts = handler.get_top_posts(keyword="fresh")
+    assert [post["title"] for post in posts] == ["Fresh Post"]
+    assert len(handler.index) == 4
+
+
+def test_indexed_retries_after_failed_first_fetch(mock_api_client):
+    """Test that an empty (failed) first fetch is not cached as the loaded state."""
+    posts = mock_api_client.fetch_data.return_value
+    mock_api_client.fetch_data.side_effect = [[], posts]
+    handler = DataHandler(mock_api_client, use_index=True)
+
+    assert handler.get_top_posts(keyword="post") == []
+    assert [post["title"] for post in handler.get_top_posts(keyword="post")] == ["Post One", "Post Two"]
+    assert mock_api_client.fetch_data.call_count == 2
+
+
+def test_indexed_refresh_failure_keeps_index(mock_api_client):
+    """Test that a refresh returning nothing does not wipe the loaded posts and index."""
+    handler = DataHandler(mock_api_client, use_index=True)
+    handler.refresh()
+    mock_api_client.fetch_data.return_value = []
+
+    handler.refresh()
+
+    assert len(handler.posts) == 3
+    assert len(handler.index) == 3
+    assert [post["title"] for post in handler.get_top_posts(keyword="special")] == ["Special Keyword"]
+
+
+def test_refresh_and_add_posts_without_index(mock_api_client):
+    """Test that the non-indexed handler can still refresh and accept posts."""
+    handler = DataHandler(mock_api_client)
+    handler.refresh()
+    handler.add_posts([{"title": "Extra", "body": "Pushed by another channel."}])
+
+    assert len(handler.posts) == 4
+    assert handler.index_memory_bytes() == 0
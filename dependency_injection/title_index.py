@@ -0,0 +1,58 @@
+import sys
+
+
+class TitleIndex:
+    """N-gram inverted index over lowercased post titles, for case-insensitive substring queries.
+
+    Keywords at least `n` characters long are answered by intersecting the
+    posting sets of their n-grams and verifying the few candidates; shorter
+    keywords fall back to scanning the pre-lowercased titles.
+    """
+
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.titles = []  # Lowercased titles, by post position
+        self.postings = {}  # n-gram -> set of post positions
+
+    def __len__(self):
+        return len(self.titles)
+
+    def _grams(self, text):
+        return {text[i: i + self.n] for i in range(len(text) - self.n + 1)}
+
+    def add(self, titles):
+        """Indexes titles appended after the ones already indexed."""
+        for title in titles:
+            position = len(self.titles)
+            title = title.lower()
+            self.titles.append(title)
+            for gram in self._grams(title):
+                self.postings.setdefault(gram, set()).add(position)
+
+    def clear(self):
+        self.titles = []
+        self.postings = {}
+
+    def search(self, keyword: str):
+        """Returns the positions of titles containing `keyword`, in ascending order."""
+        keyword = keyword.lower()
+        if len(keyword) < self.n:
+            return [i for i, title in enumerate(self.titles) if keyword in title]
+
+        postings = []
+        for gram in self._grams(keyword):
+            posting = self.postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return [i for i in sorted(candidates) if keyword in self.titles[i]]
+
+    def memory_bytes(self) -> int:
+        """Approximate memory used by the index (containers, keys and titles)."""
+        size = sys.getsizeof(self.titles) + sys.getsizeof(self.postings)
+        size += sum(sys.getsizeof(title) for title in self.titles)
+        size += sum(sys.getsizeof(gram) + sys.getsizeof(posting) for gram, posting in self.postings.items())
+        return size
@@ -0,0 +1,126 @@
+import os
+import json
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from design_patterns.factory_pattern.parse_cache import ParseCache
+from design_patterns.factory_pattern.parser_factory import ParserFactory
+from utils.generators import batched
+from utils.parallel import auto_chunksize
+
+MAX_CHUNKSIZE = 64  # Caps chunks so results stream back steadily on huge corpora
+
+
+def iter_file_paths(source, extensions=None):
+    """Yields file paths from a directory (walked recursively) or from an iterable of paths."""
+    if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+        for root, _dirs, files in os.walk(source):
+            for name in sorted(files):
+                if extensions is None or os.path.splitext(name)[1].lower() in extensions:
+                    yield os.path.join(root, name)
+    else:
+        for path in source:
+            yield os.fspath(path)
+
+
+_caches = {}  # cache_dir -> ParseCache, one per worker process
+
+
+def parse_file(file_path, cache_dir=None):
+    """Parses one file through the factory, capturing failures instead of raising."""
+    try:
+        cache = None
+        if cache_dir is not None:
+            cache = _caches.get(cache_dir) or _caches.setdefault(cache_dir, ParseCache(cache_dir))
+        result = ParserFactory.get_parser(file_path, cache=cache).parse()
+        return {"path": file_path, "ok": True, "result": result}
+    except Exception as e:
+        return {"path": file_path, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def _parse_chunk(file_paths, cache_dir=None):
+    return [parse_file(file_path, cache_dir) for file_path in file_paths]
+
+
+def adaptive_batches(paths, workers):
+    """Batches a stream of unknown length, sizing each chunk by `auto_chunksize` over the paths seen so far.
+
+    The first chunks hold a single path, so every worker starts at once, and
+    sizes grow toward `MAX_CHUNKSIZE` as a long directory walk goes on.
+    """
+    batch = []
+    size = 1
+    seen = 0
+    for path in paths:
+        batch.append(path)
+        seen += 1
+        if len(batch) >= size:
+            yield batch
+            batch = []
+            size = min(MAX_CHUNKSIZE, auto_chunksize(seen, workers))
+    if batch:
+        yield batch
+
+
+def parse_files(source, processes=None, chunksize=None, extensions=None, cache_dir=None):
+    """Generator that parses many files in a process pool and yields results as they complete.
+
+    `source` is a directory or an iterable of paths. Paths are consumed lazily
+    and at most two chunks per worker are in flight, so memory stays bounded
+    whatever the corpus size. Without `chunksize`, chunks are auto-sized from
+    the path count (capped at `MAX_CHUNKSIZE`), or grown adaptively when the
+    count is unknown, as for a walked directory. Each result is
+    `{"path", "ok", "result" | "error"}`. With `cache_dir`, unchanged files are
+    served from a shared `ParseCache`.
+    """
+    workers = processes or os.cpu_count()
+    total = len(source) if hasattr(source, "__len__") and not isinstance(source, (str, os.PathLike)) else None
+    paths = iter_file_paths(source, extensions)
+    if chunksize is None and total is None:
+        chunks = adaptive_batches(paths, workers)
+    else:
+        chunks = batched(paths, chunksize or min(MAX_CHUNKSIZE, auto_chunksize(total, workers)))
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+
+        def drain(return_when):
+            done, _ = wait(pending, return_when=return_when)
+            for future in done:
+                chunk = pending.pop(future)
+                try:
+                    yield from future.result()
+                except Exception as e:  # The worker itself died, e.g. BrokenProcessPool
+                    for file_path in chunk:
+                        yield {"path": file_path, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+        for chunk in chunks:
+            pending[executor.submit(_parse_chunk, chunk, cache_dir)] = chunk
+            if len(pending) >= max_pending:
+                yield from drain(FIRST_COMPLETED)
+
+        while pending:
+            yield from drain(FIRST_COMPLETED)
+
+
+def parse_files_to_jsonl(source, output_path, **kwargs):
+    """Streams `parse_files` results into a JSONL file; returns `{"ok": n, "failed": m}`."""
+    counts = {"ok": 0, "failed": 0}
+    with open(output_path, "w", encoding="utf-8") as output:
+        for record in parse_files(source, **kwargs):
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            counts["ok" if record["ok"] else "failed"] += 1
+    return counts
+
+
+def main():
+    resources_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../resources'))
+
+    for record in parse_files(resources_dir):
+        if record["ok"]:
+            print(f"{record['path']}: {record['result']['word_count']} words")
+        else:
+            print(f"{record['path']}: failed ({record['error']})")
+
+
+if __name__ == "__main__":
+    main()
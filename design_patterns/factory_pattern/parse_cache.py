@@ -0,0 +1,81 @@
+import os
+import pickle
+import hashlib
+from utils.disk_cache import CacheStats, DiskLRU
+
+
+class ParseCache:
+    """Persistent, content-addressed cache of `BaseParser.parse()` results.
+
+    A file's identity is its path, size and mtime, memoized to a content hash
+    (so unchanged files are never re-read); results are stored under that hash
+    plus the parser's cache token (class, version, options). Entries are written
+    to a temp file and renamed, so concurrent writers from a process pool are
+    safe, and least recently used entries are evicted past `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._stat_dir = os.path.join(cache_dir, "stat")
+        self._result_dir = os.path.join(cache_dir, "results")
+        self._store = DiskLRU([self._stat_dir, self._result_dir], max_bytes)
+        self._written = 0  # Bytes written since the last eviction pass
+
+    @staticmethod
+    def _hash(*parts):
+        return hashlib.sha256("\0".join(map(str, parts)).encode()).hexdigest()
+
+    def content_digest(self, file_path) -> str:
+        """Returns the file's content hash, only re-hashing when its path/size/mtime changed."""
+        stat = os.stat(file_path)
+        stat_path = os.path.join(
+            self._stat_dir, self._hash(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        )
+        try:
+            with open(stat_path, "r", encoding="ascii") as file:
+                digest = file.read()
+            if digest:
+                self._store.touch(stat_path)  # Memos share the LRU, so hot files must look recent too
+                return digest
+        except FileNotFoundError:
+            pass
+
+        content_hash = hashlib.blake2b(digest_size=32)
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                content_hash.update(block)
+        digest = content_hash.hexdigest()
+        self._store.write(stat_path, digest.encode("ascii"))
+        return digest
+
+    def _result_path(self, file_path, token):
+        return os.path.join(self._result_dir, self._hash(self.content_digest(file_path), repr(token)) + ".pickle")
+
+    def get(self, file_path, token):
+        """Returns the cached result for this file content and parser token, or None."""
+        path = self._result_path(file_path, token)
+        try:
+            with open(path, "rb") as file:
+                result = pickle.load(file)
+            self._store.touch(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self._store.record_miss()
+            return None
+        self._store.record_hit()
+        return result
+
+    def put(self, file_path, token, result):
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        self._store.write(self._result_path(file_path, token), data)
+        self._written += len(data)
+        if self._written >= max(self.max_bytes // 10, 1):
+            self.evict()
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits in `max_bytes`."""
+        self._written = 0
+        self._store.evict()
+
+    def stats(self) -> CacheStats:
+        return self._store.stats()
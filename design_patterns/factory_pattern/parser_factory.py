@@ -1,17 +1,109 @@
 import os.path
 import re
+import logging
+from importlib.metadata import entry_points
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
 from bs4 import BeautifulSoup  # For HTML parsing
+from html.parser import HTMLParser
 from pathlib import Path
 import PyPDF2
 
 
+logger = logging.getLogger(__name__)
+
+
+# 0. Parser Registry
+class ParserRegistry:
+    """Maps file extensions (O(1) lookup) and magic-byte signatures to parser classes."""
+
+    ENTRY_POINT_GROUP = "python_tutorials.parsers"
+    SNIFF_BYTES = 512
+
+    def __init__(self):
+        self.by_extension = {}
+        self.signatures = []  # (lowercased signature, parser class), checked in order
+        self.text_fallback = None  # Parser for headers that look like plain text
+        self._entry_points_loaded = False
+
+    def register(self, parser_class, extensions=(), signatures=(), text_fallback=False):
+        for extension in extensions:
+            self.by_extension[extension.lower()] = parser_class
+        for signature in signatures:
+            self.signatures.append((signature.lower(), parser_class))
+        if text_fallback:
+            self.text_fallback = parser_class
+        return parser_class
+
+    def load_entry_points(self):
+        """Imports third-party parsers advertised under the `python_tutorials.parsers` entry-point group."""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        for entry_point in entry_points(group=self.ENTRY_POINT_GROUP):
+            try:
+                parser_class = entry_point.load()  # Importing the class registers it
+            except Exception as e:
+                logger.warning(f"Could not load parser plugin {entry_point.name}: {e}")
+                continue
+            if parser_class not in self.by_extension.values():
+                self.register(parser_class, parser_class.extensions, parser_class.signatures)
+
+    def sniff(self, file_path):
+        """Returns the parser class whose signature matches the file header, or None."""
+        with open(file_path, "rb") as file:
+            header = file.read(self.SNIFF_BYTES)
+        head = header.removeprefix(b"\xef\xbb\xbf").lstrip().lower()
+        for signature, parser_class in self.signatures:
+            if head.startswith(signature):
+                return parser_class
+
+        if self.text_fallback is not None and b"\0" not in header:
+            try:
+                header.decode("utf-8")
+            except UnicodeDecodeError as e:
+                if e.start < len(header) - 3:  # Not just a character cut off by SNIFF_BYTES
+                    return None
+            return self.text_fallback
+        return None
+
+    def lookup(self, file_path):
+        extension = Path(file_path).suffix.lower()
+        parser_class = self.by_extension.get(extension)
+        if parser_class is None:
+            self.load_entry_points()
+            parser_class = self.by_extension.get(extension)
+        if parser_class is None and os.path.isfile(file_path):
+            parser_class = self.sniff(file_path)
+        if parser_class is None:
+            raise ValueError(f"Unsupported file type: {extension or os.path.basename(file_path)}")
+        return parser_class
+
+
+parser_registry = ParserRegistry()
+
+
 # 1. Abstract Base Parser
 class BaseParser(ABC):
-    """Base class for all parsers that adds post-processing functionality."""
+    """Base class for all parsers that adds post-processing functionality.
+
+    Subclasses register themselves with the factory through their `extensions`
+    and `signatures` (leading magic bytes, matched case-insensitively).
+    """
 
-    def __init__(self, file_path):
+    version = 1  # Bump when a parser's output changes, to invalidate cached results
+    extensions = ()
+    signatures = ()
+
+    def __init_subclass__(cls, text_fallback=False, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.extensions or cls.signatures or text_fallback:
+            parser_registry.register(cls, cls.extensions, cls.signatures, text_fallback)
+
+    def __init__(self, file_path, keep_raw_text=True, cache=None):
         self.file_path = file_path
+        self.keep_raw_text = keep_raw_text
+        self.cache = cache  # Optional ParseCache
 
     @abstractmethod
     def extract_text(self):
@@ -25,72 +117,302 @@ class BaseParser(ABC):
 
     def count_words(self, text):
         """Counts words in the extracted text."""
-        words = re.findall(r"\b\w+\b", text)
-        return len(words)
+        return sum(1 for _ in self._WORD.finditer(text))  # No list of matches is built
+
+    def cache_token(self):
+        """Identifies what produced a result: parser class, version and output-affecting options."""
+        return type(self).__module__, type(self).__qualname__, self.version, self.keep_raw_text
 
     def parse(self):
-        """Runs the parser and applies post-processing."""
+        """Runs the parser and applies post-processing (served from the cache when unchanged)."""
+        if self.cache is None:
+            return self._parse()
+
+        result = self.cache.get(self.file_path, self.cache_token())
+        if result is None:
+            result = self._parse()
+            self.cache.put(self.file_path, self.cache_token(), result)
+        return result
+
+    def _parse(self):
         text = self.extract_text()
         cleaned_text = self.clean_text(text)
         word_count = self.count_words(cleaned_text)
 
         return {
-            "raw_text": text,
+            "raw_text": text if self.keep_raw_text else None,
             "cleaned_text": cleaned_text,
             "word_count": word_count,
         }
 
+    def parse_parts(self, parts, separator="\n"):
+        """Cleans and counts text part by part (e.g. per page); same result shape as `parse()`.
+
+        Parts are joined with `separator` for `raw_text` (None if `keep_raw_text`
+        is off), so no full-document string is built before cleaning.
+        """
+        raw_parts = []
+        cleaned_parts = []
+        word_count = 0
+        for part in parts:
+            if self.keep_raw_text:
+                raw_parts.append(part)
+            cleaned = self.clean_text(part)
+            if cleaned:
+                cleaned_parts.append(cleaned)
+                word_count += self.count_words(cleaned)
+
+        return {
+            "raw_text": separator.join(raw_parts) if self.keep_raw_text else None,
+            "cleaned_text": " ".join(cleaned_parts),
+            "word_count": word_count,
+        }
+
+    _LAST_SPACE = re.compile(r".*\s", re.S)  # Greedy, so the match ends at the last whitespace
+    _WORD = re.compile(r"\b\w+\b")
+
+    def parse_stream(self, chunks, keep_cleaned_text=True):
+        """Cleans and counts a stream of text chunks that concatenate to the document.
+
+        Each buffer is cut at its last whitespace (any `str.isspace` character)
+        so no word straddles a boundary, then cleaned and counted while it is
+        still hot. Only the texts that are kept grow with the input.
+        """
+        raw_parts = []
+        cleaned_parts = []
+        word_count = 0
+        carry = ""
+
+        def consume(text):
+            if keep_cleaned_text:
+                cleaned = self.clean_text(text)
+                if cleaned:
+                    cleaned_parts.append(cleaned)
+            # Whitespace never touches a word, so counting the raw span equals counting the cleaned one
+            return self.count_words(text)
+
+        for chunk in chunks:
+            if self.keep_raw_text:
+                raw_parts.append(chunk)
+            buffer = carry + chunk
+            match = self._LAST_SPACE.match(buffer)
+            cut = match.end() - 1 if match else -1
+            if cut <= 0:
+                carry = buffer  # No whitespace yet: the token continues in the next chunk
+                continue
+            word_count += consume(buffer[:cut])
+            carry = buffer[cut:]
+        word_count += consume(carry)
+
+        return {
+            "raw_text": "".join(raw_parts) if self.keep_raw_text else None,
+            "cleaned_text": " ".join(cleaned_parts) if keep_cleaned_text else None,
+            "word_count": word_count,
+        }
+
 
 # 2. Concrete Parser Classes
-class TxtParser(BaseParser):
-    """Parser for TXT files."""
+class TxtParser(BaseParser, text_fallback=True):
+    """Parser for TXT files (and the fallback for unknown files that look like text).
+
+    `stream=True` reads `chunk_size` characters at a time and cleans and counts
+    each chunk as it arrives, cutting chunks at whitespace so words are never
+    split. With `keep_raw_text=False` and `keep_cleaned_text=False` memory stays
+    constant whatever the file size, and only the word count is returned.
+    """
+
+    extensions = (".txt",)
+
+    def __init__(self, file_path, stream=False, chunk_size=1 << 20, keep_raw_text=True,
+                 keep_cleaned_text=True, cache=None):
+        super().__init__(file_path, keep_raw_text=keep_raw_text, cache=cache)
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.keep_cleaned_text = keep_cleaned_text
 
     def extract_text(self):
         with open(self.file_path, "r", encoding="utf-8") as file:
             return file.read()
 
+    def cache_token(self):
+        return super().cache_token() + (self.keep_cleaned_text,)
+
+    def _parse(self):
+        if not self.stream:
+            result = super()._parse()
+            if not self.keep_cleaned_text:
+                result["cleaned_text"] = None
+            return result
+
+        with open(self.file_path, "r", encoding="utf-8") as file:
+            chunks = iter(lambda: file.read(self.chunk_size), "")
+            return self.parse_stream(chunks, keep_cleaned_text=self.keep_cleaned_text)
+
+
+class _StreamingTextExtractor(HTMLParser):
+    """Collects text nodes as the HTML is fed, skipping script/style/template content and never building a tree."""
+
+    SKIPPED_TAGS = {"script", "style", "template"}  # Same as BeautifulSoup get_text()
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+    def unknown_decl(self, data):
+        if data.startswith("CDATA["):  # BeautifulSoup keeps CDATA text too
+            self.handle_data(data[len("CDATA["):])
+
 
 class HtmlParser(BaseParser):
-    """Parser for HTML files."""
+    """Parser for HTML files.
+
+    `backend="bs4"` (the default) builds a BeautifulSoup tree and calls
+    `get_text()`. `backend="stream"` feeds the file in chunks to a stdlib
+    `HTMLParser` and cleans/counts the text as it is emitted.
+    """
+
+    version = 2  # The stream backend skips <template> content (like bs4) since version 2
+    extensions = (".html", ".htm")
+    signatures = (b"<!doctype html", b"<html")
+    BACKENDS = ("bs4", "stream")
+
+    def __init__(self, file_path, backend="bs4", chunk_size=1 << 16, keep_raw_text=True, cache=None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported HTML backend: {backend}")
+        super().__init__(file_path, keep_raw_text=keep_raw_text, cache=cache)
+        self.backend = backend
+        self.chunk_size = chunk_size
+
+    def iter_text(self):
+        """Yields text incrementally from the streaming extractor."""
+        extractor = _StreamingTextExtractor()
+        with open(self.file_path, "r", encoding="utf-8") as file:
+            for chunk in iter(lambda: file.read(self.chunk_size), ""):
+                extractor.feed(chunk)
+                yield from extractor.parts
+                extractor.parts.clear()
+        extractor.close()
+        yield from extractor.parts
 
     def extract_text(self):
+        if self.backend == "stream":
+            return "".join(self.iter_text())
+
         with open(self.file_path, "r", encoding="utf-8") as file:
             html_content = file.read()
             soup = BeautifulSoup(html_content, "html.parser")
             return soup.get_text()
 
+    def cache_token(self):
+        return super().cache_token() + (self.backend,)
+
+    def _parse(self):
+        if self.backend == "stream":
+            return self.parse_stream(self.iter_text())
+        return super()._parse()
+
 
 class PdfParser(BaseParser):
-    """Parser for PDF files."""
+    """Parser for PDF files.
 
-    def extract_text(self):
+    `stream=True` extracts, cleans and counts one page at a time; `workers=N`
+    splits the page range across N processes. Both return the same result as
+    the default whole-document path.
+    """
+
+    extensions = (".pdf",)
+    signatures = (b"%PDF-",)
+
+    def __init__(self, file_path, stream=False, workers=None, keep_raw_text=True, cache=None):
+        super().__init__(file_path, keep_raw_text=keep_raw_text, cache=cache)
+        self.stream = stream
+        self.workers = workers
+
+    def iter_pages(self, start=0, stop=None):
+        """Yields the text of pages `start` to `stop` lazily."""
         if PyPDF2 is None:
             raise ImportError("PyPDF2 is required to parse PDFs.")
 
-        text = []
         with open(self.file_path, "rb") as file:
             reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                text.append(page.extract_text() or "")
-        return "\n".join(text)
+            stop = len(reader.pages) if stop is None else min(stop, len(reader.pages))
+            for index in range(start, stop):
+                yield reader.pages[index].extract_text() or ""
+
+    def extract_text(self):
+        return "\n".join(self.iter_pages())
+
+    def page_count(self):
+        with open(self.file_path, "rb") as file:
+            return len(PyPDF2.PdfReader(file).pages)
+
+    def _parse(self):
+        if self.workers and self.workers > 1:
+            return self._parse_parallel()
+        if self.stream:
+            return self.parse_parts(self.iter_pages())
+        return super()._parse()
+
+    def _parse_parallel(self):
+        pages = self.page_count()
+        workers = min(self.workers, pages) or 1
+        bounds = [pages * i // workers for i in range(workers + 1)]
+        ranges = list(zip(bounds, bounds[1:]))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_parse_pdf_pages, self.file_path, start, stop, self.keep_raw_text)
+                for start, stop in ranges
+            ]
+            results = [future.result() for future in futures]
+
+        return {
+            "raw_text": "\n".join(result["raw_text"] for result in results) if self.keep_raw_text else None,
+            "cleaned_text": " ".join(result["cleaned_text"] for result in results if result["cleaned_text"]),
+            "word_count": sum(result["word_count"] for result in results),
+        }
+
+
+def _parse_pdf_pages(file_path, start, stop, keep_raw_text):
+    """Parses one page range of a PDF (runs inside a worker process)."""
+    parser = PdfParser(file_path, keep_raw_text=keep_raw_text)
+    return parser.parse_parts(parser.iter_pages(start, stop))
 
 
 # 3. Factory Class
 class ParserFactory:
-    """Factory that returns the appropriate parser based on file type."""
+    """Factory that returns the appropriate parser based on file type.
+
+    The parser is looked up by extension, then by sniffing the file header, so
+    misnamed or extensionless files still work. New formats plug in by
+    subclassing `BaseParser` (or through the `python_tutorials.parsers` entry
+    points) instead of editing the factory.
+    """
 
     @staticmethod
-    def get_parser(file_path):
-        extension = Path(file_path).suffix.lower()
+    def register(parser_class=None, *, extensions=(), signatures=()):
+        """Registers a parser class for extra extensions / signatures (also as a class decorator)."""
+        if parser_class is None:
+            return lambda cls: parser_registry.register(cls, extensions, signatures)
+        return parser_registry.register(parser_class, extensions, signatures)
 
-        if extension == ".txt":
-            return TxtParser(file_path)
-        elif extension == ".html":
-            return HtmlParser(file_path)
-        elif extension == ".pdf":
-            return PdfParser(file_path)
-        else:
-            raise ValueError(f"Unsupported file type: {extension}")
+    @staticmethod
+    def get_parser(file_path, **options):
+        """Returns a parser for `file_path`; `options` (e.g. `cache`) go to its constructor."""
+        return parser_registry.lookup(file_path)(file_path, **options)
 
 
 def main():
@@ -0,0 +1,80 @@
+import json
+from design_patterns.factory_pattern.batch_parser import (
+    MAX_CHUNKSIZE, adaptive_batches, parse_files, parse_files_to_jsonl,
+)
+from design_patterns.factory_pattern.parser_factory import TxtParser
+
+
+def write_texts(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(f"document number {i}\n" * (i + 1), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_parse_files_captures_per_file_errors(tmp_path):
+    """Test that a failing file becomes an error record while the others still parse."""
+    paths = write_texts(tmp_path, 3)
+    missing = str(tmp_path / "missing.txt")
+
+    records = {record["path"]: record for record in parse_files(paths + [missing], processes=2, chunksize=1)}
+
+    assert set(records) == set(paths) | {missing}
+    assert not records[missing]["ok"]
+    assert records[missing]["error"].startswith("FileNotFoundError")
+    for path in paths:
+        assert records[path]["ok"]
+        assert records[path]["result"] == TxtParser(path).parse()
+
+
+def test_parse_files_bounds_in_flight_chunks(tmp_path):
+    """Test that paths are pulled lazily: at most two chunks per worker before the first result."""
+    paths = write_texts(tmp_path, 20)
+    consumed = []
+
+    def source():
+        for path in paths:
+            consumed.append(path)
+            yield path
+
+    results = parse_files(source(), processes=1, chunksize=2)
+    next(results)
+    assert len(consumed) <= 2 * 2  # max_pending (2 chunks) * chunksize
+
+    assert len(list(results)) == len(paths) - 1
+
+
+def test_parse_files_to_jsonl(tmp_path):
+    """Test that every record is written as one JSON line and the counts add up."""
+    paths = write_texts(tmp_path, 4) + [str(tmp_path / "missing.txt")]
+    output_path = tmp_path / "out.jsonl"
+
+    counts = parse_files_to_jsonl(paths, output_path, processes=2)
+
+    records = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert counts == {"ok": 4, "failed": 1}
+    assert sorted(record["path"] for record in records) == sorted(paths)
+    assert sum(record["ok"] for record in records) == 4
+
+
+def test_adaptive_batches_grow_toward_the_cap():
+    """Test that chunks of an unsized stream start small and grow to MAX_CHUNKSIZE without losing paths."""
+    paths = [f"doc{i}.txt" for i in range(5000)]
+
+    sizes = [len(batch) for batch in adaptive_batches(iter(paths), workers=2)]
+
+    assert sizes[:3] == [1, 1, 1]
+    assert sizes[:-1] == sorted(sizes[:-1])
+    assert max(sizes) == MAX_CHUNKSIZE
+    assert sum(sizes) == len(paths)
+
+
+def test_parse_files_walks_directories(tmp_path):
+    paths = write_texts(tmp_path, 12)
+
+    records = list(parse_files(str(tmp_path), processes=2))
+
+    assert sorted(record["path"] for record in records) == sorted(paths)
+    assert all(record["ok"] for record in records)
@@ -0,0 +1,86 @@
+import os
+from unittest.mock import patch
+from design_patterns.factory_pattern.parse_cache import ParseCache
+from design_patterns.factory_pattern.parser_factory import TxtParser
+
+
+def test_cache_hit_skips_parsing(tmp_path):
+    """Test that a second parse of an unchanged file is served from the cache."""
+    path = tmp_path / "doc.txt"
+    path.write_text("hello cached world", encoding="utf-8")
+    cache = ParseCache(str(tmp_path / "cache"))
+
+    first = TxtParser(str(path), cache=cache).parse()
+    with patch.object(TxtParser, "_parse", side_effect=AssertionError("parsed again")):
+        second = TxtParser(str(path), cache=cache).parse()
+
+    assert second == first
+    assert cache.stats()[:2] == (1, 1)  # hits, misses
+
+
+def test_cache_invalidated_by_content_change(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text("one two", encoding="utf-8")
+    cache = ParseCache(str(tmp_path / "cache"))
+    assert TxtParser(str(path), cache=cache).parse()["word_count"] == 2
+
+    path.write_text("one two three", encoding="utf-8")
+
+    assert TxtParser(str(path), cache=cache).parse()["word_count"] == 3
+    assert cache.stats().hits == 0
+
+
+def test_cache_invalidated_by_parser_version(tmp_path, monkeypatch):
+    """Test that bumping a parser's version (or changing its options) misses the old entries."""
+    path = tmp_path / "doc.txt"
+    path.write_text("one two", encoding="utf-8")
+    cache = ParseCache(str(tmp_path / "cache"))
+    TxtParser(str(path), cache=cache).parse()
+
+    monkeypatch.setattr(TxtParser, "version", TxtParser.version + 1)
+    TxtParser(str(path), cache=cache).parse()
+    TxtParser(str(path), keep_raw_text=False, cache=cache).parse()
+
+    assert cache.stats()[:2] == (0, 3)
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"), max_bytes=4096)
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(f"{i} " + "word " * 200, encoding="utf-8")
+        paths.append(str(path))
+        TxtParser(str(path), cache=cache).parse()
+
+    cache.evict()
+
+    stats = cache.stats()
+    assert stats.currsize_bytes <= 4096
+    assert stats.evictions > 0
+    assert cache.get(paths[-1], TxtParser(paths[-1]).cache_token()) is not None
+
+
+def test_hot_file_memos_survive_eviction(tmp_path):
+    """Test that re-parsed files keep their stat memos, so they are not re-hashed after `evict()`."""
+    cache_dir = str(tmp_path / "cache")
+    cache = ParseCache(cache_dir)
+    paths = []
+    for i in range(30):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(f"{i} " + "word " * 50, encoding="utf-8")
+        paths.append(str(path))
+        TxtParser(str(path), cache=cache).parse()
+    for _, _, entry in cache._store.entries():
+        os.utime(entry, (1, 1))  # Written by an earlier run
+
+    # Next run, with the cache at capacity: only a third of the files are used again
+    cache = ParseCache(cache_dir, max_bytes=cache.stats().currsize_bytes // 2)
+    for path in paths[:10]:
+        TxtParser(path, cache=cache).parse()
+    cache.evict()
+
+    with patch("hashlib.blake2b", side_effect=AssertionError("re-hashed a hot file")):
+        for path in paths[:10]:
+            cache.content_digest(path)
+    assert cache.stats().evictions > 0
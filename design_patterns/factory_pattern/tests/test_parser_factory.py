@@ -0,0 +1,148 @@
+import os
+import shutil
+import pytest
+from design_patterns.factory_pattern.parser_factory import (
+    BaseParser, HtmlParser, ParserFactory, PdfParser, TxtParser, parser_registry,
+)
+
+RESOURCES_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../resources'))
+
+
+@pytest.fixture
+def restore_registry():
+    """Restores the global parser registry after a test registers its own parsers."""
+    saved = dict(parser_registry.by_extension), list(parser_registry.signatures), parser_registry.text_fallback
+    yield parser_registry
+    parser_registry.by_extension, parser_registry.signatures, parser_registry.text_fallback = saved
+
+
+@pytest.fixture
+def html_path():
+    return os.path.join(RESOURCES_DIR, "sample1.html")
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1 << 16])
+def test_stream_html_backend_matches_bs4(html_path, chunk_size):
+    """Test that the streaming HTML backend extracts the same text as BeautifulSoup."""
+    expected = HtmlParser(html_path).parse()
+    result = HtmlParser(html_path, backend="stream", chunk_size=chunk_size).parse()
+
+    assert result["cleaned_text"] == expected["cleaned_text"]
+    assert result["word_count"] == expected["word_count"]
+
+
+def test_stream_html_backend_skips_script_and_style(tmp_path):
+    """Test that script/style/template content is dropped and entities are decoded."""
+    path = tmp_path / "page.html"
+    path.write_text(
+        "<html><head><style>p {color: red}</style><script>var x = 1;</script></head>"
+        "<body><p>Fish &amp; chips</p><script>alert('hi')</script><template><p>hidden</p></template>"
+        "<p>done</p></body></html>",
+        encoding="utf-8",
+    )
+
+    result = HtmlParser(str(path), backend="stream").parse()
+
+    assert result["cleaned_text"] == "Fish & chipsdone"
+    assert result["cleaned_text"] == HtmlParser(str(path)).parse()["cleaned_text"]
+
+
+def test_unknown_html_backend(html_path):
+    with pytest.raises(ValueError):
+        HtmlParser(html_path, backend="lxml")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_stream_txt_matches_default(tmp_path, chunk_size):
+    """Test that chunked TXT parsing matches the whole-file path across chunk boundaries."""
+    path = tmp_path / "sample.txt"
+    path.write_text("  Héllo,\twörld!\n\nfoo_bar   baz-qux \r\n end", encoding="utf-8")
+
+    expected = TxtParser(str(path)).parse()
+    result = TxtParser(str(path), stream=True, chunk_size=chunk_size).parse()
+
+    assert result == expected
+    assert TxtParser(str(path), stream=True, keep_raw_text=False, keep_cleaned_text=False).parse() == {
+        "raw_text": None, "cleaned_text": None, "word_count": expected["word_count"],
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8])
+def test_stream_txt_cuts_at_unicode_whitespace(tmp_path, chunk_size):
+    """Test that non-ASCII whitespace (NBSP, em space, separators) is a safe cut point too."""
+    path = tmp_path / "unicode.txt"
+    path.write_text("alpha\u00a0beta\u2003gamma\x1cdelta\u3000épsilon\u2028zeta", encoding="utf-8")
+
+    expected = TxtParser(str(path)).parse()
+
+    assert TxtParser(str(path), stream=True, chunk_size=chunk_size).parse() == expected
+    assert expected["word_count"] == 6
+
+    spans = []
+    parser = TxtParser(str(path), stream=True, chunk_size=chunk_size)
+    parser.count_words = lambda text: spans.append(text) or 0
+    parser.parse()
+    assert max(map(len, spans)) < chunk_size + len("épsilon ")  # Cut per chunk, not carried to the end
+
+
+@pytest.mark.parametrize("options", [{"stream": True}, {"workers": 2}])
+def test_pdf_stream_and_workers_match_default(options):
+    """Test that per-page and multi-process PDF parsing return the same result as the default path."""
+    path = os.path.join(RESOURCES_DIR, "sample3.pdf")
+
+    assert PdfParser(path, **options).parse() == PdfParser(path).parse()
+
+
+@pytest.mark.parametrize("name, parser_class", [
+    ("sample1.html", HtmlParser),
+    ("sample2.txt", TxtParser),
+    ("sample3.pdf", PdfParser),
+])
+def test_get_parser_by_extension(name, parser_class):
+    assert type(ParserFactory.get_parser(os.path.join(RESOURCES_DIR, name))) is parser_class
+
+
+@pytest.mark.parametrize("name, target, parser_class", [
+    ("sample3.pdf", "upload", PdfParser),
+    ("sample1.html", "page.dat", HtmlParser),
+    ("sample2.txt", "notes", TxtParser),
+])
+def test_get_parser_sniffs_unknown_extensions(tmp_path, name, target, parser_class):
+    """Test that files with missing or unknown extensions are recognized from their header."""
+    path = tmp_path / target
+    shutil.copy(os.path.join(RESOURCES_DIR, name), path)
+
+    assert type(ParserFactory.get_parser(str(path))) is parser_class
+
+
+def test_get_parser_rejects_binary(tmp_path):
+    path = tmp_path / "blob.bin"
+    path.write_bytes(b"\x00\x01\x02\x03 not a document")
+
+    with pytest.raises(ValueError):
+        ParserFactory.get_parser(str(path))
+
+
+def test_get_parser_rejects_missing_file_with_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        ParserFactory.get_parser(str(tmp_path / "missing.unknown"))
+
+
+def test_register_third_party_parser(tmp_path, restore_registry):
+    """Test that a new format plugs in without editing the factory."""
+
+    class CsvParser(BaseParser):
+        extensions = (".csv-test",)
+
+        def extract_text(self):
+            with open(self.file_path, encoding="utf-8") as file:
+                return file.read().replace(",", " ")
+
+    path = tmp_path / "table.csv-test"
+    path.write_text("a,b,c", encoding="utf-8")
+
+    parser = ParserFactory.get_parser(str(path))
+
+    assert isinstance(parser, CsvParser)
+    assert parser.parse()["word_count"] == 3
+
@@ -0,0 +1,89 @@
+import os
+import numpy as np
+import pandas as pd
+
+
+def smallest_int_dtype(*arrays):
+    """Returns the smallest integer dtype that holds every value of the given integer arrays."""
+    low = min((int(array.min()) for array in arrays if len(array)), default=0)
+    high = max((int(array.max()) for array in arrays if len(array)), default=0)
+    return np.result_type(np.min_scalar_type(low), np.min_scalar_type(high))
+
+
+class PredictionColumns:
+    """Column source for the evaluators: NumPy arrays, optionally memory-mapped from `.npy` files.
+
+    Indexing works like a DataFrame (`columns["actual"]`), so it can be passed
+    wherever the evaluators expect one. Columns saved with `save` are stored
+    with the smallest sufficient integer dtype (non-integer labels are encoded
+    as codes, with the label values kept in `labels`). Loaded columns are
+    `np.memmap`s: only the pages that are read hit memory, several processes
+    share them through the page cache, and pickling sends the directory path
+    instead of the data.
+    """
+
+    def __init__(self, columns: dict, labels=None, directory=None):
+        self.columns = columns
+        self.labels = labels
+        self.directory = directory
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __reduce__(self):
+        if self.directory is not None:
+            return type(self).load, (self.directory,)
+        return type(self), (self.columns, self.labels)
+
+    @classmethod
+    def save(cls, df, directory, columns=("actual", "predicted")):
+        """Writes `columns` of a DataFrame (or dict of arrays) as compact `.npy` files; returns the mapped source."""
+        os.makedirs(directory, exist_ok=True)
+        arrays = {name: np.asarray(df[name]) for name in columns}
+        # Object columns (e.g. pandas strings) can't be memory-mapped; fixed-width unicode can
+        arrays = {name: array.astype(str) if array.dtype == object else array for name, array in arrays.items()}
+        label_columns = [name for name in ("actual", "predicted") if name in arrays]
+
+        if all(arrays[name].dtype.kind in "iub" for name in label_columns):
+            dtype = smallest_int_dtype(*(arrays[name] for name in label_columns))
+            for name in label_columns:
+                arrays[name] = arrays[name].astype(dtype)
+        else:
+            values = [arrays[name] for name in label_columns]
+            labels, codes = np.unique(np.concatenate(values), return_inverse=True)
+            codes = codes.astype(np.min_scalar_type(max(len(labels) - 1, 0)))
+            splits = np.cumsum([len(value) for value in values])[:-1]
+            arrays.update(zip(label_columns, np.split(codes, splits)))
+            np.save(os.path.join(directory, "labels.npy"), labels)
+
+        for name, array in arrays.items():
+            if name not in label_columns and array.dtype.kind in "iu":
+                array = array.astype(smallest_int_dtype(array))
+            np.save(os.path.join(directory, f"{name}.npy"), array)
+        return cls.load(directory)
+
+    @classmethod
+    def load(cls, directory, mmap_mode="r"):
+        """Memory-maps every `<column>.npy` file in `directory`."""
+        columns = {}
+        labels = None
+        for file_name in sorted(os.listdir(directory)):
+            name, extension = os.path.splitext(file_name)
+            if extension != ".npy":
+                continue
+            path = os.path.join(directory, file_name)
+            if name == "labels":
+                labels = np.load(path)
+            else:
+                columns[name] = np.load(path, mmap_mode=mmap_mode)
+        return cls(columns, labels=labels, directory=directory)
+
+    @classmethod
+    def from_arrays(cls, **columns):
+        return cls({name: np.asarray(values) for name, values in columns.items()})
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame({name: np.asarray(values) for name, values in self.columns.items()})
@@ -0,0 +1,135 @@
+import numpy as np
+
+
+class ConfusionMatrix:
+    """Confusion matrix over a sorted label set, counted once and shared by every metric.
+
+    `counts[i, j]` is the number of rows with actual `labels[i]` and predicted
+    `labels[j]`. Counts may carry leading batch axes, shape (..., k, k), and the
+    metric functions below are vectorized over them.
+    """
+
+    def __init__(self, labels, counts):
+        self.labels = np.asarray(labels)
+        self.counts = np.asarray(counts, dtype=np.int64)
+
+    # Integer labels spanning at most this many values are counted without sorting
+    MAX_DENSE_SPAN = 1024
+    # Rows per bincount pass on the dense path, bounding temporaries for huge (memory-mapped) columns
+    CHUNK_ROWS = 1 << 22
+
+    @classmethod
+    def from_arrays(cls, y_true, y_pred, labels=None):
+        """Counts a confusion matrix in a single `np.bincount` pass."""
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        if labels is None and len(y_true) and y_true.dtype.kind in "iub" and y_pred.dtype.kind in "iub":
+            low = min(int(y_true.min()), int(y_pred.min()))
+            span = max(int(y_true.max()), int(y_pred.max())) - low + 1
+            if span <= cls.MAX_DENSE_SPAN:
+                return cls._from_dense_ints(y_true, y_pred, low, span)
+        if labels is None:
+            labels = np.union1d(y_true, y_pred)  # Sorted, like sklearn's label set
+        labels = np.asarray(labels)
+        k = len(labels)
+        true_index = np.searchsorted(labels, y_true)
+        pred_index = np.searchsorted(labels, y_pred)
+        counts = np.bincount(true_index * k + pred_index, minlength=k * k).reshape(k, k)
+        return cls(labels, counts)
+
+    @classmethod
+    def _from_dense_ints(cls, y_true, y_pred, low, span):
+        """Bincounts small integer labels by offset (no union/searchsorted), chunk by chunk.
+
+        Each chunk is widened to int64 on its own, so a memory-mapped column of
+        compact dtype is streamed through the page cache instead of copied whole.
+        """
+        counts = np.zeros(span * span, dtype=np.int64)
+        for start in range(0, len(y_true), cls.CHUNK_ROWS):
+            stop = start + cls.CHUNK_ROWS
+            cell = (y_true[start:stop].astype(np.int64) - low) * span + (y_pred[start:stop].astype(np.int64) - low)
+            counts += np.bincount(cell, minlength=span * span)
+        counts = counts.reshape(span, span)
+        present = np.flatnonzero(counts.sum(axis=0) + counts.sum(axis=1))
+        labels = (present + low).astype(np.result_type(y_true.dtype, y_pred.dtype))
+        return cls(labels, counts[np.ix_(present, present)])
+
+    @classmethod
+    def from_segments(cls, segments, y_true, y_pred):
+        """Counts one matrix per segment in a single combined-index `np.bincount` pass.
+
+        Returns `(segment_values, matrix)` where `matrix.counts` has shape
+        (segments, k, k) over the global label set. Labels absent from a
+        segment have zero rows/columns and are skipped by the macro averages.
+        """
+        segment_values, segment_index = np.unique(np.asarray(segments), return_inverse=True)
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        labels = np.union1d(y_true, y_pred)
+        k = len(labels)
+        cell = np.searchsorted(labels, y_true) * k + np.searchsorted(labels, y_pred)
+        counts = np.bincount(segment_index * (k * k) + cell, minlength=len(segment_values) * k * k)
+        return segment_values, cls(labels, counts.reshape(len(segment_values), k, k))
+
+    @classmethod
+    def empty(cls):
+        return cls(np.array([]), np.zeros((0, 0), dtype=np.int64))
+
+    @property
+    def total(self):
+        return self.counts.sum(axis=(-2, -1))
+
+    def merge(self, other):
+        """Returns the sum of two matrices, aligning their label sets (e.g. partials from workers)."""
+        if not len(other.labels):
+            return self
+        if not len(self.labels):
+            return other
+        if np.array_equal(self.labels, other.labels):
+            return ConfusionMatrix(self.labels, self.counts + other.counts)
+
+        labels = np.union1d(self.labels, other.labels)
+        counts = np.zeros((len(labels), len(labels)), dtype=np.int64)
+        for matrix in (self, other):
+            index = np.searchsorted(labels, matrix.labels)
+            counts[np.ix_(index, index)] += matrix.counts
+        return ConfusionMatrix(labels, counts)
+
+    __add__ = merge
+
+
+def _divide(numerator, denominator):
+    """Element-wise division that yields 0 where the denominator is 0 (sklearn's zero_division)."""
+    return np.divide(numerator, denominator, out=np.zeros(np.shape(numerator)), where=denominator != 0)
+
+
+def _macro(per_class, counts):
+    """Averages per-class scores over the labels present in y_true or y_pred, as sklearn does."""
+    present = (counts.sum(axis=-1) + counts.sum(axis=-2)) > 0
+    return _divide((per_class * present).sum(axis=-1), present.sum(axis=-1))
+
+
+def accuracy(counts):
+    return _divide(np.diagonal(counts, axis1=-2, axis2=-1).sum(axis=-1), counts.sum(axis=(-2, -1)))
+
+
+def macro_precision(counts):
+    true_positives = np.diagonal(counts, axis1=-2, axis2=-1)
+    return _macro(_divide(true_positives, counts.sum(axis=-2)), counts)
+
+
+def macro_recall(counts):
+    true_positives = np.diagonal(counts, axis1=-2, axis2=-1)
+    return _macro(_divide(true_positives, counts.sum(axis=-1)), counts)
+
+
+def macro_f1(counts):
+    # 2·tp / (2·tp + fp + fn), where 2·tp + fp + fn = predicted + actual per class
+    true_positives = np.diagonal(counts, axis1=-2, axis2=-1)
+    return _macro(_divide(2 * true_positives, counts.sum(axis=-2) + counts.sum(axis=-1)), counts)
+
+
+def as_result(value):
+    """Returns plain floats for single matrices and arrays for batched ones."""
+    value = np.asarray(value)
+    return float(value) if value.ndim == 0 else value
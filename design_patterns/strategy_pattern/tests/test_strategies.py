@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import accuracy_score, balanced_accuracy_score, f1_score, precision_score, recall_score
+import pickle
+from design_patterns.strategy_pattern import with_methods
+from design_patterns.strategy_pattern.columns import PredictionColumns
+from design_patterns.strategy_pattern.confusion_matrix import ConfusionMatrix
+from design_patterns.strategy_pattern.with_class import (
+    AccuracyEvaluation, EvaluationStrategy, F1Evaluation, IncrementalEvaluator, ModelEvaluator, PrecisionEvaluation,
+    RecallEvaluation,
+)
+
+STRATEGIES = [AccuracyEvaluation(), PrecisionEvaluation(), RecallEvaluation(), F1Evaluation()]
+
+
+def sklearn_metrics(df):
+    y_true, y_pred = df["actual"], df["predicted"]
+    return {
+        "accuracy": accuracy_score(y_true, y_pred),
+        "precision": precision_score(y_true, y_pred, average="macro", zero_division=0),
+        "recall": recall_score(y_true, y_pred, average="macro", zero_division=0),
+        "f1": f1_score(y_true, y_pred, average="macro", zero_division=0),
+    }
+
+
+@pytest.fixture(params=["binary", "multiclass", "strings", "unseen_prediction"])
+def predictions(request):
+    """Creates prediction DataFrames, including labels that only appear in the predictions."""
+    rng = np.random.default_rng(7)
+    if request.param == "binary":
+        actual, predicted = rng.integers(0, 2, 500), rng.integers(0, 2, 500)
+    elif request.param == "multiclass":
+        actual = rng.integers(0, 6, 2000)
+        predicted = np.where(rng.random(2000) < 0.6, actual, rng.integers(0, 6, 2000))
+    elif request.param == "strings":
+        actual = rng.choice(["cat", "dog", "owl"], 300)
+        predicted = rng.choice(["cat", "dog", "owl"], 300)
+    else:
+        actual = np.array([0, 1, 1, 2, 2, 2])
+        predicted = np.array([0, 1, 3, 2, 2, 3])
+    return pd.DataFrame({"actual": actual, "predicted": predicted})
+
+
+def test_evaluate_many_matches_sklearn(predictions):
+    results = ModelEvaluator(AccuracyEvaluation()).evaluate_many(predictions, STRATEGIES)
+
+    assert results == pytest.approx(sklearn_metrics(predictions))
+
+
+def test_single_strategy_matches_sklearn(predictions):
+    expected = sklearn_metrics(predictions)
+    evaluator = ModelEvaluator(AccuracyEvaluation())
+
+    for strategy in STRATEGIES:
+        evaluator.set_strategy(strategy)
+        assert evaluator.evaluate(predictions) == pytest.approx(expected[strategy.name])
+
+
+def test_function_strategies_match_sklearn(predictions):
+    evaluator = with_methods.ModelEvaluator(predictions)
+    results = evaluator.evaluate_many([
+        with_methods.accuracy_evaluation, with_methods.precision_evaluation,
+        with_methods.recall_evaluation, with_methods.f1_evaluation,
+    ])
+
+    expected = sklearn_metrics(predictions)
+    assert results == pytest.approx({f"{name}_evaluation": value for name, value in expected.items()})
+
+
+def test_evaluate_chunks_matches_in_memory(predictions, tmp_path):
+    """Test that streaming CSV chunks gives the same metrics as the whole DataFrame."""
+    path = tmp_path / "predictions.csv"
+    predictions.to_csv(path, index=False)
+    evaluator = ModelEvaluator(AccuracyEvaluation())
+
+    with pd.read_csv(path, chunksize=97) as reader:
+        results = evaluator.evaluate_chunks(reader, STRATEGIES)
+
+    assert results == pytest.approx(evaluator.evaluate_many(predictions, STRATEGIES))
+
+
+def test_incremental_partials_merge(predictions):
+    """Test that partial states with different label sets merge into the in-memory result."""
+    half = len(predictions) // 2
+    first = IncrementalEvaluator(STRATEGIES).update(predictions.iloc[:half])
+    second = IncrementalEvaluator(STRATEGIES).update(
+        (predictions["actual"].to_numpy()[half:], predictions["predicted"].to_numpy()[half:])
+    )
+
+    merged = first.merge(second).result()
+
+    assert merged == pytest.approx(sklearn_metrics(predictions))
+    assert first.matrix.counts.sum() == len(predictions)
+
+
+def test_evaluate_segments_matches_groupby():
+    """Test that vectorized per-segment metrics match a groupby loop with sklearn."""
+    rng = np.random.default_rng(11)
+    rows = 5000
+    actual = rng.integers(0, 4, rows)
+    df = pd.DataFrame({
+        "segment": rng.integers(0, 50, rows),
+        "actual": actual,
+        "predicted": np.where(rng.random(rows) < 0.5, actual, rng.integers(0, 4, rows)),
+    })
+
+    result = ModelEvaluator(AccuracyEvaluation()).evaluate_segments(df, "segment", STRATEGIES)
+
+    assert len(result) == df["segment"].nunique()
+    for row in result.itertuples(index=False):
+        group = df[df["segment"] == row.segment]
+        expected = sklearn_metrics(group)
+        assert row.rows == len(group)
+        assert {name: getattr(row, name) for name in expected} == pytest.approx(expected)
+
+
+class BalancedAccuracyEvaluation(EvaluationStrategy):
+    """A third-party strategy written against the original `evaluate`-only interface."""
+
+    name = "balanced_accuracy"
+
+    def evaluate(self, y_true, y_pred):
+        return balanced_accuracy_score(y_true, y_pred)
+
+
+def test_evaluate_only_strategy_still_plugs_in():
+    """Test that a strategy without `from_confusion` works with evaluate, evaluate_many and segments."""
+    rng = np.random.default_rng(3)
+    actual = rng.integers(0, 3, 600)
+    df = pd.DataFrame({
+        "segment": rng.choice(["a", "b", "c"], 600),
+        "actual": actual,
+        "predicted": np.where(rng.random(600) < 0.7, actual, rng.integers(0, 3, 600)),
+    })
+    strategy = BalancedAccuracyEvaluation()
+    evaluator = ModelEvaluator(strategy)
+    expected = balanced_accuracy_score(df["actual"], df["predicted"])
+
+    assert evaluator.evaluate(df) == pytest.approx(expected)
+    many = evaluator.evaluate_many(df, [strategy, AccuracyEvaluation()])
+    assert many == pytest.approx({
+        "balanced_accuracy": expected, "accuracy": accuracy_score(df["actual"], df["predicted"]),
+    })
+
+    segments = evaluator.evaluate_segments(df, "segment", [strategy, AccuracyEvaluation()])
+    for row in segments.itertuples(index=False):
+        group = df[df["segment"] == row.segment]
+        assert row.balanced_accuracy == pytest.approx(balanced_accuracy_score(group["actual"], group["predicted"]))
+
+    with pytest.raises(TypeError, match="from_confusion"):
+        evaluator.bootstrap(df, n_resamples=10)
+    with pytest.raises(TypeError, match="from_confusion"):
+        IncrementalEvaluator([strategy])
+
+
+def test_bootstrap_is_reproducible(predictions):
+    """Test that a seeded bootstrap gives the same intervals serially and across processes."""
+    evaluator = ModelEvaluator(AccuracyEvaluation())
+
+    serial = evaluator.bootstrap(predictions, STRATEGIES, n_resamples=300, batch_size=64, seed=3)
+    parallel = evaluator.bootstrap(predictions, STRATEGIES, n_resamples=300, batch_size=64, seed=3, processes=2)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert (serial["low"] <= serial["estimate"]).all()
+    assert (serial["estimate"] <= serial["high"]).all()
+    assert serial["estimate"].to_dict() == pytest.approx(sklearn_metrics(predictions))
+
+
+def test_memory_mapped_columns_match_dataframe(predictions, tmp_path):
+    columns = PredictionColumns.save(predictions, tmp_path)
+
+    assert isinstance(columns["actual"], np.memmap)
+    assert columns["actual"].dtype.itemsize == 1  # Smallest sufficient integer dtype (or label codes)
+    assert ModelEvaluator(AccuracyEvaluation()).evaluate_many(columns, STRATEGIES) == pytest.approx(
+        sklearn_metrics(predictions)
+    )
+    assert with_methods.ModelEvaluator.from_npy(tmp_path, with_methods.f1_evaluation).evaluate() == pytest.approx(
+        sklearn_metrics(predictions)["f1"]
+    )
+
+
+def test_memory_mapped_columns_pickle_by_path(predictions, tmp_path):
+    columns = PredictionColumns.save(predictions, tmp_path)
+    payload = pickle.dumps(columns)
+
+    assert len(payload) < 500  # Workers re-map the files instead of receiving the data
+    assert np.array_equal(pickle.loads(payload)["predicted"], columns["predicted"])
+
+
+def test_dense_integer_path_matches_general_path(monkeypatch):
+    monkeypatch.setattr(ConfusionMatrix, "CHUNK_ROWS", 1000)  # Several bincount passes
+    rng = np.random.default_rng(3)
+    y_true = rng.integers(-2, 40, 10_000).astype(np.int16)
+    y_pred = np.where(rng.random(10_000) < 0.5, y_true, rng.integers(-2, 40, 10_000)).astype(np.int16)
+    general = ConfusionMatrix.from_arrays(y_true, y_pred, labels=np.union1d(y_true, y_pred))
+
+    dense = ConfusionMatrix.from_arrays(y_true, y_pred)
+
+    assert np.array_equal(dense.labels, general.labels)
+    assert np.array_equal(dense.counts, general.counts)
@@ -1,49 +1,92 @@
-from abc import ABC, abstractmethod
+import tempfile
+from abc import ABC
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+from design_patterns.strategy_pattern.columns import PredictionColumns
+from design_patterns.strategy_pattern.confusion_matrix import (
+    ConfusionMatrix, accuracy, as_result, macro_f1, macro_precision, macro_recall,
+)
 
 
 # 1. Strategy Interface
 class EvaluationStrategy(ABC):
-    """Abstract base class for evaluation strategies."""
+    """Abstract base class for evaluation strategies.
+
+    A strategy implements `evaluate(y_true, y_pred)`, or `from_confusion` to
+    derive its metric from a shared confusion matrix, so evaluating several of
+    them on the same data counts it only once. Evaluate-only strategies still
+    work everywhere the raw predictions are available (`evaluate_many`,
+    `evaluate_segments`); bootstrap and chunked evaluation need `from_confusion`.
+    """
+
+    name = None
+
+    def from_confusion(self, matrix: ConfusionMatrix):
+        """Optional hook: the metric for a confusion matrix (or a stack of them)."""
+        raise NotImplementedError(f"{type(self).__name__} does not implement from_confusion")
+
+    @property
+    def supports_confusion(self) -> bool:
+        return type(self).from_confusion is not EvaluationStrategy.from_confusion
 
-    @abstractmethod
     def evaluate(self, y_true, y_pred):
-        pass
+        if not self.supports_confusion:
+            raise NotImplementedError(f"{type(self).__name__} must implement evaluate or from_confusion")
+        return self.from_confusion(ConfusionMatrix.from_arrays(y_true, y_pred))
+
+
+def _require_confusion(strategies, operation):
+    for strategy in strategies:
+        if not strategy.supports_confusion:
+            raise TypeError(f"{operation} needs strategies that implement from_confusion, "
+                            f"but {type(strategy).__name__} only implements evaluate")
 
 
 # 2. Concrete Strategies
 class AccuracyEvaluation(EvaluationStrategy):
     """Concrete Strategy: Computes Accuracy."""
 
-    def evaluate(self, y_true, y_pred):
-        return accuracy_score(y_true, y_pred)
+    name = "accuracy"
+
+    def from_confusion(self, matrix):
+        return as_result(accuracy(matrix.counts))
 
 
 class PrecisionEvaluation(EvaluationStrategy):
-    """Concrete Strategy: Computes Precision."""
+    """Concrete Strategy: Computes Precision (macro-averaged)."""
 
-    def evaluate(self, y_true, y_pred):
-        return precision_score(y_true, y_pred, average="macro")
+    name = "precision"
+
+    def from_confusion(self, matrix):
+        return as_result(macro_precision(matrix.counts))
 
 
 class RecallEvaluation(EvaluationStrategy):
-    """Concrete Strategy: Computes Recall."""
+    """Concrete Strategy: Computes Recall (macro-averaged)."""
 
-    def evaluate(self, y_true, y_pred):
-        return recall_score(y_true, y_pred, average="macro")
+    name = "recall"
+
+    def from_confusion(self, matrix):
+        return as_result(macro_recall(matrix.counts))
 
 
 class F1Evaluation(EvaluationStrategy):
-    """Concrete Strategy: Computes F1-score."""
+    """Concrete Strategy: Computes F1-score (macro-averaged)."""
 
-    def evaluate(self, y_true, y_pred):
-        return f1_score(y_true, y_pred, average="macro")
+    name = "f1"
+
+    def from_confusion(self, matrix):
+        return as_result(macro_f1(matrix.counts))
 
 
 # 3. Context Class
 class ModelEvaluator:
-    """Context class that applies the selected evaluation strategy."""
+    """Context class that applies the selected evaluation strategy.
+
+    `df` can be a DataFrame or any column source indexed by column name, such
+    as a `PredictionColumns` memory-mapped from `.npy` files.
+    """
 
     def __init__(self, strategy: EvaluationStrategy):
         self.strategy = strategy  # Injecting evaluation strategy
@@ -58,6 +101,118 @@ class ModelEvaluator:
         y_pred = df["predicted"]
         return self.strategy.evaluate(y_true, y_pred)
 
+    def evaluate_many(self, df: pd.DataFrame, strategies=None):
+        """Applies several strategies from one confusion matrix; returns {strategy name: value}."""
+        y_true, y_pred = df["actual"], df["predicted"]
+        matrix = ConfusionMatrix.from_arrays(y_true, y_pred)
+        return {
+            strategy.name: strategy.from_confusion(matrix) if strategy.supports_confusion
+            else strategy.evaluate(y_true, y_pred)
+            for strategy in strategies or [self.strategy]
+        }
+
+    def evaluate_segments(self, df: pd.DataFrame, segment_column: str, strategies=None) -> pd.DataFrame:
+        """Applies the strategies per segment (e.g. customer or region) in one vectorized pass.
+
+        Returns a tidy DataFrame with one row per segment: the segment value,
+        its row count and one column per strategy.
+        """
+        segments, matrix = ConfusionMatrix.from_segments(df[segment_column], df["actual"], df["predicted"])
+        result = {segment_column: segments, "rows": matrix.total}
+        for strategy in strategies or [self.strategy]:
+            if strategy.supports_confusion:
+                result[strategy.name] = strategy.from_confusion(matrix)
+            else:  # Evaluate-only strategies get one call per segment
+                column = np.asarray(df[segment_column])
+                y_true, y_pred = np.asarray(df["actual"]), np.asarray(df["predicted"])
+                result[strategy.name] = [
+                    strategy.evaluate(y_true[column == segment], y_pred[column == segment]) for segment in segments
+                ]
+        return pd.DataFrame(result)
+
+    def bootstrap(self, df: pd.DataFrame, strategies=None, n_resamples=1000, confidence=0.95, seed=None,
+                  batch_size=250, processes=None) -> pd.DataFrame:
+        """Percentile bootstrap confidence intervals for each strategy.
+
+        Resampling rows with replacement only changes how many rows land in
+        each confusion-matrix cell, so every resample's matrix is drawn as a
+        multinomial over the observed cell frequencies: O(classes²) per
+        resample instead of O(rows). Batches get their own seeds spawned from
+        `seed`, so results are reproducible whether or not `processes` is used.
+        """
+        strategies = strategies or [self.strategy]
+        _require_confusion(strategies, "bootstrap")  # Resamples are drawn as matrices, not rows
+        matrix = ConfusionMatrix.from_arrays(df["actual"], df["predicted"])
+        sizes = [min(batch_size, n_resamples - start) for start in range(0, n_resamples, batch_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        jobs = [(matrix, size, batch_seed, strategies) for size, batch_seed in zip(sizes, seeds)]
+
+        if processes and processes > 1:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                batches = list(executor.map(_bootstrap_batch, *zip(*jobs)))
+        else:
+            batches = [_bootstrap_batch(*job) for job in jobs]
+
+        alpha = (1 - confidence) / 2
+        rows = []
+        for strategy in strategies:
+            values = np.concatenate([batch[strategy.name] for batch in batches])
+            low, high = np.quantile(values, [alpha, 1 - alpha])
+            rows.append({
+                "metric": strategy.name, "estimate": strategy.from_confusion(matrix),
+                "low": low, "high": high, "std": values.std(ddof=1),
+            })
+        return pd.DataFrame(rows).set_index("metric")
+
+    def evaluate_chunks(self, chunks, strategies=None):
+        """Evaluates data that does not fit in memory, e.g. `pd.read_csv(path, chunksize=...)`."""
+        return IncrementalEvaluator(strategies or [self.strategy]).consume(chunks).result()
+
+
+def _bootstrap_batch(matrix, size, seed, strategies):
+    """Draws `size` bootstrap confusion matrices and scores them (runs in a worker when parallel)."""
+    rng = np.random.default_rng(seed)
+    total = int(matrix.total)
+    probabilities = matrix.counts.ravel() / total
+    counts = rng.multinomial(total, probabilities, size=size).reshape((size,) + matrix.counts.shape)
+    resampled = ConfusionMatrix(matrix.labels, counts)
+    return {strategy.name: strategy.from_confusion(resampled) for strategy in strategies}
+
+
+class IncrementalEvaluator:
+    """Out-of-core evaluator that folds chunks into a mergeable confusion matrix.
+
+    Chunks can be DataFrames with `actual`/`predicted` columns or
+    `(y_true, y_pred)` pairs of arrays. Only the matrix is kept, so memory is
+    O(classes²) however many rows are consumed, and evaluators filled by
+    different workers can be combined with `merge`.
+    """
+
+    def __init__(self, strategies):
+        self.strategies = list(strategies)
+        _require_confusion(self.strategies, "IncrementalEvaluator")  # Only the matrix is kept
+        self.matrix = ConfusionMatrix.empty()
+
+    def update(self, chunk):
+        if isinstance(chunk, tuple):
+            y_true, y_pred = chunk
+        else:
+            y_true, y_pred = chunk["actual"], chunk["predicted"]
+        self.matrix = self.matrix.merge(ConfusionMatrix.from_arrays(y_true, y_pred))
+        return self
+
+    def consume(self, chunks):
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def merge(self, other: "IncrementalEvaluator"):
+        self.matrix = self.matrix.merge(other.matrix)
+        return self
+
+    def result(self):
+        return {strategy.name: strategy.from_confusion(self.matrix) for strategy in self.strategies}
+
 
 # 4. Usage Example
 if __name__ == "__main__":
@@ -80,3 +235,23 @@ if __name__ == "__main__":
 
     evaluator.set_strategy(F1Evaluation())
     print(f"F1-score: {evaluator.evaluate(df):.2f}")
+
+    # All metrics from a single confusion matrix
+    strategies = [AccuracyEvaluation(), PrecisionEvaluation(), RecallEvaluation(), F1Evaluation()]
+    print(evaluator.evaluate_many(df, strategies))
+
+    # Same metrics per segment, from one vectorized pass
+    df["region"] = ["eu", "us"] * 5
+    print(evaluator.evaluate_segments(df, "region", strategies))
+
+    # 95% bootstrap confidence intervals (reproducible with a seed)
+    print(evaluator.bootstrap(df, strategies, n_resamples=1000, seed=42))
+
+    # Same metrics, streamed in chunks (e.g. from pd.read_csv(path, chunksize=1_000_000))
+    chunks = (df.iloc[i: i + 3] for i in range(0, len(df), 3))
+    print(evaluator.evaluate_chunks(chunks, strategies))
+
+    # Same metrics from memory-mapped, compactly typed .npy columns
+    with tempfile.TemporaryDirectory() as directory:
+        columns = PredictionColumns.save(df, directory, columns=("actual", "predicted", "region"))
+        print(columns["actual"].dtype, evaluator.evaluate_many(columns, strategies))
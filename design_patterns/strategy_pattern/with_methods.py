@@ -1,14 +1,38 @@
 import pandas as pd
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+from design_patterns.strategy_pattern.columns import PredictionColumns
+from design_patterns.strategy_pattern.confusion_matrix import (
+    ConfusionMatrix, accuracy, as_result, macro_f1, macro_precision, macro_recall,
+)
 
 # 2. ModelEvaluator Class
 class ModelEvaluator:
     """Context class that applies an evaluation strategy function."""
 
     def __init__(self, df: pd.DataFrame, strategy=None):
-        self.df = df  # Store the dataframe inside the instance
+        self.df = df  # Store the dataframe (or any column source, e.g. PredictionColumns) inside the instance
         self.strategy = strategy if strategy else accuracy_evaluation  # Default strategy
 
+    @classmethod
+    def from_npy(cls, directory: str, strategy=None):
+        """Evaluator over `actual.npy` / `predicted.npy` memory-mapped from `directory` (see `PredictionColumns`)."""
+        return cls(PredictionColumns.load(directory), strategy)
+
+    @property
+    def df(self):
+        return self._df
+
+    @df.setter
+    def df(self, df):
+        self._df = df
+        self._confusion_matrix = None  # Recount lazily for the new data
+
+    @property
+    def confusion_matrix(self) -> ConfusionMatrix:
+        """Confusion matrix of the stored DataFrame, counted once and shared by all strategies."""
+        if self._confusion_matrix is None:
+            self._confusion_matrix = ConfusionMatrix.from_arrays(self.df["actual"], self.df["predicted"])
+        return self._confusion_matrix
+
     def set_strategy(self, strategy):
         """Allows changing the strategy dynamically."""
         self.strategy = strategy
@@ -17,27 +41,31 @@ class ModelEvaluator:
         """Applies the evaluation strategy function to itself."""
         return self.strategy(self)  # Pass `self` to the external function
 
+    def evaluate_many(self, strategies):
+        """Applies several strategy functions; returns {function name: value}."""
+        return {strategy.__name__: strategy(self) for strategy in strategies}
+
 
 
 # 1. Define Evaluation Functions Outside the Class
 def accuracy_evaluation(evaluator: ModelEvaluator):
-    """Evaluates accuracy using the evaluator's stored DataFrame."""
-    return accuracy_score(evaluator.df["actual"], evaluator.df["predicted"])
+    """Evaluates accuracy using the evaluator's confusion matrix."""
+    return as_result(accuracy(evaluator.confusion_matrix.counts))
 
 
 def precision_evaluation(evaluator: ModelEvaluator):
-    """Evaluates precision using the evaluator's stored DataFrame."""
-    return precision_score(evaluator.df["actual"], evaluator.df["predicted"], average="macro")
+    """Evaluates macro precision using the evaluator's confusion matrix."""
+    return as_result(macro_precision(evaluator.confusion_matrix.counts))
 
 
 def recall_evaluation(evaluator: ModelEvaluator):
-    """Evaluates recall using the evaluator's stored DataFrame."""
-    return recall_score(evaluator.df["actual"], evaluator.df["predicted"], average="macro")
+    """Evaluates macro recall using the evaluator's confusion matrix."""
+    return as_result(macro_recall(evaluator.confusion_matrix.counts))
 
 
 def f1_evaluation(evaluator: ModelEvaluator):
-    """Evaluates F1-score using the evaluator's stored DataFrame."""
-    return f1_score(evaluator.df["actual"], evaluator.df["predicted"], average="macro")
+    """Evaluates macro F1-score using the evaluator's confusion matrix."""
+    return as_result(macro_f1(evaluator.confusion_matrix.counts))
 
 
 def main():
@@ -60,6 +88,9 @@ def main():
     # Change strategy dynamically to F1-score
     print(f"F1-score: {ModelEvaluator(df, f1_evaluation).evaluate():.2f}")
 
+    # All metrics from one confusion matrix
+    print(ModelEvaluator(df).evaluate_many([accuracy_evaluation, precision_evaluation, recall_evaluation, f1_evaluation]))
+
 
 # 3. Usage Example
 if __name__ == "__main__":
@@ -1,3 +1,7 @@
+import os
+from utils.generators import read_lines_mmap, map_file_ranges
+
+
 def generate_enumerate(iterable):
     """Generator using enumerate() - iterates with an index."""
     return enumerate(iterable)  # ✅ Returns an iterator
@@ -35,6 +39,11 @@ def read_file_line_by_line(file_path):
             yield line.strip()  # ✅ Yield each line lazily
 
 
+def count_non_empty_lines(file_path, start, end):
+    """Counts non-empty lines in a byte range (runs inside a worker process)."""
+    return sum(1 for line in read_lines_mmap(file_path, start, end) if line.strip())
+
+
 def main():
     print("\n\n🔹 enumerate indexing Example:")
     try:
@@ -72,6 +81,13 @@ def main():
     # for line in read_file_line_by_line("data.txt"):
     #     print(line)
 
+    print("\n🔹 mmap Example (bytes lines, decoded only when asked):")
+    sample_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../resources/sample2.txt")
+    for line in read_lines_mmap(sample_path, encoding="utf-8"):
+        print(line[:60])
+        break
+    print(f"Non-empty lines (parallel): {sum(map_file_ranges(sample_path, count_non_empty_lines))}")
+
 
 # 🎯 Running the Demonstrations
 if __name__ == "__main__":
@@ -1,12 +1,29 @@
-from utils.generators import chunk_list
+import asyncio
+import numpy as np
+from utils.generators import batched, abatched
 
 
-def main():
-    data = list(range(10))  # [0,1,2,3,4,5,6,7,8,9]
+async def slow_numbers():
+    for i in range(7):
+        await asyncio.sleep(0.1)
+        yield i
+
+
+async def batch_async():
+    # Flushes every 3 items, or after 0.25s if the stream is slow
+    async for batch in abatched(slow_numbers(), 3, max_wait=0.25):
+        print(batch)
+
 
-    for chunk in chunk_list(data, 3):
+def main():
+    for chunk in batched(range(10), 3):  # Any iterable, nothing materialized up front
         print(chunk)
 
+    for view in batched(np.arange(10), 4):  # Zero-copy NumPy views
+        print(view)
+
+    asyncio.run(batch_async())
+
 
 if __name__ == '__main__':
     main()
@@ -1,6 +1,13 @@
-from utils.generators import fetch_paginated_data
+import asyncio
+from utils.general import API_BASE_URL
+from utils.generators import fetch_paginated_data, fetch_paginated_data_async
 
-API_URL = "https://jsonplaceholder.typicode.com/posts"  # Fake API
+API_URL = f"{API_BASE_URL}/posts"  # Fake API (or `python -m utils.local_api` with API_BASE_URL=http://127.0.0.1:8000)
+
+
+async def fetch_async():
+    async for row in fetch_paginated_data_async(API_URL, max_pages=3, prefetch=3):
+        print(f"Async row: {row[:40]}...")
 
 
 def main():
@@ -9,6 +16,12 @@ def main():
     for page_data in fetch_paginated_data(API_URL, max_pages=3):
         print(f"Page: {page_data}...")  # Print first 2 items per page
 
+    # Keep 3 pages in flight on worker threads, rows still arrive in page order
+    for page_data in fetch_paginated_data(API_URL, max_pages=3, prefetch=3):
+        print(f"Prefetched: {page_data[:40]}...")
+
+    asyncio.run(fetch_async())
+
 
 if __name__ == '__main__':
     main()
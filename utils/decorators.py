@@ -1,6 +1,12 @@
 import time
+import random
+import asyncio
+import inspect
 import logging
-from functools import wraps
+import threading
+from collections import OrderedDict, deque, namedtuple
+from functools import partial, wraps
+from utils import metrics
 from utils.general import init_basic_logger
 
 logger = logging.getLogger(__name__)
@@ -21,50 +27,310 @@ def log_exceptions(func):
 
 
 # 1. Timing Decorator
-def time_it(func):
-    """Decorator to measure execution time of a function."""
+def time_it(func=None, *, name=None, sample_every=1, registry=None):
+    """Decorator to record the execution time of a sync or async function.
+
+    Timings go to `utils.metrics.registry` (count, total, p50/p95/p99) under
+    `module.qualname` (or `name`) instead of stdout; print `registry.to_table()`
+    to see them. With `sample_every=N` only
+    every N-th call is timed, which keeps the overhead negligible on hot paths.
+    """
+    if func is None:
+        return partial(time_it, name=name, sample_every=sample_every, registry=registry)
+
+    stats = (registry or metrics.registry).get(name or f"{func.__module__}.{func.__qualname__}")
+    perf_counter_ns = time.perf_counter_ns
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if sample_every > 1 and stats.tick() % sample_every:
+                return await func(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                stats.record(perf_counter_ns() - start)
+
+        return async_wrapper
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
-        result = func(*args, **kwargs)
-        end = time.time()
-        print(f"{func.__name__} executed in {end - start:.4f} seconds")
-        return result
+        if sample_every > 1 and stats.tick() % sample_every:
+            return func(*args, **kwargs)
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.record(perf_counter_ns() - start)
 
     return wrapper
 
 
-def save_to_dict(storage_dict):
-    """Decorator to save function output to a dictionary using the first argument as the key."""
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class _Loading:
+    """A value being computed by one thread while others wait for it (single-flight)."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_KWARGS_MARK = object()
+
+
+def _make_key(args, kwargs):
+    return args if not kwargs else args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def ttl_cache(maxsize=128, ttl=None):
+    """Decorator that caches results in a thread-safe LRU store with an optional per-entry TTL.
+
+    Concurrent misses for the same arguments are coalesced: one call computes the
+    value and the others wait for it. Use `cache_info()` / `cache_clear()` like `lru_cache`.
+    """
 
     def decorator(func):
+        store = OrderedDict()  # key -> (value, expires_at)
+        loading = {}  # key -> _Loading
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        def lookup(key):
+            entry = store.get(key)
+            if entry is None:
+                return False, None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del store[key]
+                return False, None
+            store.move_to_end(key)
+            return True, value
+
         @wraps(func)
-        def wrapper(key, *args, **kwargs):
-            result = func(key, *args, **kwargs)  # Call original function
-            if isinstance(result, dict):  # Ensure output is a dictionary
-                storage_dict[key] = result
-            return result
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            with lock:
+                found, value = lookup(key)
+                if found:
+                    stats["hits"] += 1
+                    return value
+                stats["misses"] += 1
+                pending = loading.get(key)
+                owner = pending is None
+                if owner:
+                    pending = loading[key] = _Loading()
+
+            if not owner:
+                pending.event.wait()
+                if pending.error is not None:
+                    raise pending.error
+                return pending.result
+
+            try:
+                pending.result = func(*args, **kwargs)
+            except BaseException as e:
+                pending.error = e
+                raise
+            else:
+                expires_at = time.monotonic() + ttl if ttl is not None else None
+                with lock:
+                    store[key] = (pending.result, expires_at)
+                    store.move_to_end(key)
+                    while len(store) > maxsize:
+                        store.popitem(last=False)
+                        stats["evictions"] += 1
+                return pending.result
+            finally:
+                with lock:
+                    del loading[key]
+                pending.event.set()
+
+        def cache_info():
+            with lock:
+                return CacheInfo(stats["hits"], stats["misses"], stats["evictions"], maxsize, len(store))
 
+        def cache_clear():
+            with lock:
+                store.clear()
+                stats.update(hits=0, misses=0, evictions=0)
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
         return wrapper
 
     return decorator
 
 
-def retry(max_attempts=3, delay=1):
-    """Decorator to retry a function multiple times if it fails."""
+class RetryBudget:
+    """Caps how many retries a process may spend within a sliding time window."""
+
+    def __init__(self, max_retries=100, per_seconds=60.0):
+        self.max_retries = max_retries
+        self.per_seconds = per_seconds
+        self._spent = deque()
+        self._lock = threading.Lock()
+
+    def try_spend(self):
+        """Consumes one retry from the budget, returning False once it is exhausted."""
+        now = time.monotonic()
+        with self._lock:
+            while self._spent and now - self._spent[0] >= self.per_seconds:
+                self._spent.popleft()
+            if len(self._spent) >= self.max_retries:
+                return False
+            self._spent.append(now)
+            return True
+
+
+class CircuitBreaker:
+    """Fails fast while a dependency keeps failing, probing it again after `reset_timeout`.
+
+    Once half-open, a single probe call is let through and every other caller
+    fails fast until the probe records a success (closing the circuit) or a
+    failure (opening it again). A probe that never reports back is replaced
+    after another `reset_timeout`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started = None  # When the in-flight half-open probe was let through
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+            return self._state
+
+    def allow_request(self):
+        """Returns True if a call may go through: always when closed, once per probe when half-open."""
+        state = self.state
+        if state != self.HALF_OPEN:
+            return state == self.CLOSED
+        with self._lock:
+            now = time.monotonic()
+            if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                return False  # A probe is already in flight
+            self._probe_started = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probe_started = None
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+def _backoff_delay(attempt, delay, backoff, max_delay, jitter):
+    """Delay before retry number `attempt` (0-based), optionally with full jitter."""
+    wait = delay * backoff ** attempt
+    if max_delay is not None:
+        wait = min(wait, max_delay)
+    return random.uniform(0, wait) if jitter else wait
+
+
+def retry(max_attempts=3, delay=1, backoff=1, max_delay=None, jitter=False,
+          exceptions=(Exception,), budget=None, circuit_breaker=None, reraise=False):
+    """Decorator to retry a sync or async function multiple times if it fails.
+
+    Only `exceptions` are retried; anything else propagates immediately (after
+    being recorded as a failure by `circuit_breaker`). Async
+    functions wait with `asyncio.sleep`, so the event loop is never blocked.
+    When it gives up after a failure it returns None, or re-raises the last
+    error with `reraise=True`.
+    """
+
+    def on_failure(func, attempt, error):
+        print(f"Attempt {attempt + 1} failed: {error}")
+        if circuit_breaker is not None:
+            circuit_breaker.record_failure()
+        if attempt == max_attempts - 1:
+            print(f"All {max_attempts} attempts failed.")
+            return None
+        if circuit_breaker is not None and not circuit_breaker.allow_request():
+            print(f"Circuit open for {func.__name__}, giving up.")
+            return None
+        if budget is not None and not budget.try_spend():
+            print(f"Retry budget exhausted, giving up on {func.__name__}.")
+            return None
+        return _backoff_delay(attempt, delay, backoff, max_delay, jitter)
+
+    def on_unexpected():
+        # Not retried, but still a failed call: it counts toward opening and frees a half-open probe
+        if circuit_breaker is not None:
+            circuit_breaker.record_failure()
+
+    def on_success(result):
+        if circuit_breaker is not None:
+            circuit_breaker.record_success()
+        return result
+
+    def is_open(func):
+        if circuit_breaker is not None and not circuit_breaker.allow_request():
+            print(f"Circuit open for {func.__name__}, failing fast.")
+            return True
+        return False
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if is_open(func):
+                    return None
+                for attempt in range(max_attempts):
+                    try:
+                        return on_success(await func(*args, **kwargs))
+                    except exceptions as e:
+                        wait = on_failure(func, attempt, e)
+                        if wait is None:
+                            if reraise:
+                                raise
+                            return None
+                    except Exception:
+                        on_unexpected()
+                        raise
+                    await asyncio.sleep(wait)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
+            if is_open(func):
+                return None
             for attempt in range(max_attempts):
                 try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    print(f"Attempt {attempt + 1} failed: {e}")
-                    time.sleep(delay)
-            print(f"All {max_attempts} attempts failed.")
-            return None
+                    return on_success(func(*args, **kwargs))
+                except exceptions as e:
+                    wait = on_failure(func, attempt, e)
+                    if wait is None:
+                        if reraise:
+                            raise
+                        return None
+                except Exception:
+                    on_unexpected()
+                    raise
+                time.sleep(wait)
 
         return wrapper
 
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import threading
+from collections import namedtuple
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "evictions", "currsize_bytes", "maxsize_bytes"])
+
+
+class DiskLRU:
+    """Byte-bounded store of cache files in one or more directories, evicted least recently used first.
+
+    Files are written to a temp file and renamed, so concurrent writers (threads
+    or a process pool) never expose a partial entry. Recency is the file mtime:
+    call `touch` on a hit. Only files ending in `suffix` (all but temp files if
+    None) count as entries. Hit/miss/eviction counters are per instance.
+    """
+
+    def __init__(self, directories, max_bytes: int, suffix: str = None):
+        self.directories = list(directories)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        for directory in self.directories:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def record_hit(self):
+        with self._lock:
+            self._hits += 1
+
+    def record_miss(self):
+        with self._lock:
+            self._misses += 1
+
+    @staticmethod
+    def touch(path):
+        os.utime(path)  # Mark as recently used
+
+    @staticmethod
+    def write(path, data: bytes):
+        """Atomically replaces `path` with `data`."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def entries(self):
+        """Returns `(mtime, size, path)` for every entry file."""
+        entries = []
+        for directory in self.directories:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".tmp") or (self.suffix and not entry.name.endswith(self.suffix)):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue  # Removed by another process
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        """Removes least recently used entries until the store fits in `max_bytes`."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            with self._lock:
+                self._evictions += 1
+
+    def clear(self):
+        for _, _, path in self.entries():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> CacheStats:
+        size = sum(size for _, size, _ in self.entries())
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, size, self.max_bytes)
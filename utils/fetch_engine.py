@@ -0,0 +1,158 @@
+import time
+import asyncio
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from utils.metrics import TimingStats
+
+FetchResult = namedtuple("FetchResult", ["index", "key", "ok", "value", "error"])
+
+
+class FetchStats:
+    """Summary of one engine run: counts, wall time, throughput and per-request latency."""
+
+    def __init__(self):
+        self._lock = threading.Lock()  # Thread-backend workers record concurrently
+        self.total = 0
+        self.ok = 0
+        self.errors = 0
+        self.started = time.perf_counter()
+        self.finished = None
+        self.latency = TimingStats()  # Per-request latency in ns (p50/p95/p99 via `snapshot()`)
+
+    def record(self, result: FetchResult, elapsed_ns: int):
+        with self._lock:
+            self.total += 1
+            if result.ok:
+                self.ok += 1
+            else:
+                self.errors += 1
+        self.latency.record(elapsed_ns)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        latency = self.latency.snapshot()
+        p95 = f"{latency['p95_ns'] / 1e6:.1f} ms" if latency["p95_ns"] is not None else "n/a"
+        return (f"{self.total} requests ({self.ok} ok, {self.errors} errors) in {self.elapsed:.2f}s, "
+                f"{self.throughput:.1f} req/s, p95 latency {p95}")
+
+
+class FetchEngine:
+    """Fetches many keys (e.g. post ids) with bounded concurrency, streaming results as they complete.
+
+    At most `concurrency` requests run at once and at most `max_pending`
+    (default twice that) are queued or finished-but-unconsumed. Keys are
+    pulled from the iterable lazily only as the window frees up, so 100k ids
+    cost 100k small tasks over time rather than 100k sockets or threads at
+    once, and a slow consumer slows the producers down. With `ordered=True`
+    results come back in key order (a slow head request holds the window).
+    Failures are reported as `FetchResult(ok=False, error=...)` rather than
+    raised, and `stats` summarizes the latest run.
+    """
+
+    def __init__(self, concurrency: int = 32, max_pending: int = None, timeout: float = 10.0,
+                 ordered: bool = False):
+        self.concurrency = concurrency
+        self.max_pending = max(max_pending or concurrency * 2, concurrency)
+        self.timeout = timeout
+        self.ordered = ordered
+        self.stats = FetchStats()
+
+    # 1. Thread backend
+    def stream(self, fetch, keys):
+        """Generator over `FetchResult`s, running the blocking `fetch(key, timeout=...)` on a thread pool.
+
+        Threads can't be interrupted, so `fetch` must honour `timeout` itself
+        (e.g. `requests.get(url, timeout=timeout)`).
+        """
+        self.stats = FetchStats()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        pending = deque()  # Futures in key order
+
+        def run(index, key):
+            start = time.perf_counter_ns()
+            try:
+                result = FetchResult(index, key, True, fetch(key, timeout=self.timeout), None)
+            except Exception as e:
+                result = FetchResult(index, key, False, None, f"{type(e).__name__}: {e}")
+            self.stats.record(result, time.perf_counter_ns() - start)
+            return result
+
+        def drain():
+            if self.ordered:
+                yield pending.popleft().result()
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                yield future.result()
+
+        try:
+            for index, key in enumerate(keys):
+                pending.append(executor.submit(run, index, key))
+                if len(pending) >= self.max_pending:
+                    yield from drain()
+            while pending:
+                yield from drain()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)  # Also when the consumer stops early
+            self.stats.finished = time.perf_counter()
+
+    # 2. Asyncio backend
+    async def astream(self, fetch, keys):
+        """Async generator over `FetchResult`s for the coroutine function `fetch(key)`.
+
+        Each request is cancelled after `timeout` seconds.
+        """
+        self.stats = FetchStats()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = deque()  # Tasks in key order
+
+        async def run(index, key):
+            async with semaphore:
+                start = time.perf_counter_ns()
+                try:
+                    result = FetchResult(index, key, True, await asyncio.wait_for(fetch(key), self.timeout), None)
+                except Exception as e:  # Includes TimeoutError from wait_for
+                    result = FetchResult(index, key, False, None, f"{type(e).__name__}: {e}")
+                self.stats.record(result, time.perf_counter_ns() - start)
+                return result
+
+        async def drain():
+            if self.ordered:
+                return [await pending.popleft()]
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.remove(task)
+            return [task.result() for task in done]
+
+        try:
+            for index, key in enumerate(keys):
+                pending.append(asyncio.ensure_future(run(index, key)))
+                if len(pending) >= self.max_pending:
+                    for result in await drain():
+                        yield result
+            while pending:
+                for result in await drain():
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()  # Consumer stopped early
+            await asyncio.gather(*pending, return_exceptions=True)
+            self.stats.finished = time.perf_counter()
+
+    # 3. Collect helpers
+    def fetch_all(self, fetch, keys) -> list:
+        """Runs `stream` to completion and returns the results in key order."""
+        return sorted(self.stream(fetch, keys), key=lambda result: result.index)
+
+    async def afetch_all(self, fetch, keys) -> list:
+        return sorted([result async for result in self.astream(fetch, keys)], key=lambda result: result.index)
@@ -1,7 +1,11 @@
+import os
 import sys
 import logging
 import logging.config
 
+# Base URL of the posts API used by the I/O examples; point it at `utils.local_api` for offline runs
+API_BASE_URL = os.environ.get("API_BASE_URL", "https://jsonplaceholder.typicode.com")
+
 
 def init_basic_logger():
     logging.basicConfig(
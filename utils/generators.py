@@ -1,23 +1,276 @@
+import os
+import mmap
+import time
+import asyncio
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import aiohttp
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 
 
-def chunk_list(lst, chunk_size):
-    """Generator that yields chunks of a list of size `chunk_size`."""
-    for i in range(0, len(lst), chunk_size):
-        yield lst[i: i + chunk_size]  # ✅ Returns a slice of the list
+def batched(iterable, batch_size, max_wait=None):
+    """Generator that yields batches of up to `batch_size` items from any iterable.
 
+    Only one batch is held in memory at a time. With `max_wait` (seconds) a
+    partial batch is flushed once it has been open that long; the check runs as
+    items arrive, since a blocking iterator cannot be interrupted. NumPy arrays,
+    bytes and memoryviews are sliced into zero-copy views instead of lists.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
 
-def fetch_paginated_data(api_url, max_pages=5):
-    """Generator that fetches API data page by page."""
-    page = 1
-    while page <= max_pages:
-        response = requests.get(api_url, params={"page": page})
-        data = response.json()
+    if isinstance(iterable, (bytes, bytearray, memoryview, np.ndarray)):
+        view = iterable if isinstance(iterable, np.ndarray) else memoryview(iterable)
+        for i in range(0, len(view), batch_size):
+            yield view[i: i + batch_size]  # ✅ A view, no copy
+        return
 
-        if not data:
-            break  # Stop if no more data
+    batch = []
+    deadline = None
+    for item in iterable:
+        if not batch and max_wait is not None:
+            deadline = time.monotonic() + max_wait
+        batch.append(item)
+        if len(batch) >= batch_size or (deadline is not None and time.monotonic() >= deadline):
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
-        for row in data:
-            yield row["body"]  # ✅ Yield each page
 
-        page += 1  # Move to next page
+async def abatched(iterable, batch_size, max_wait=None):
+    """Async generator that batches an async (or sync) iterable, flushing on size or `max_wait`."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    if not hasattr(iterable, "__aiter__"):
+        for batch in batched(iterable, batch_size, max_wait):
+            yield batch
+        return
+
+    iterator = iterable.__aiter__()
+    loop = asyncio.get_running_loop()
+    batch = []
+    deadline = None
+    next_item = None
+    try:
+        while True:
+            if next_item is None:
+                next_item = asyncio.ensure_future(iterator.__anext__())
+            timeout = max(deadline - loop.time(), 0) if batch and deadline is not None else None
+            done, _ = await asyncio.wait({next_item}, timeout=timeout)
+            if not done:  # Time limit hit while waiting: flush, keep waiting for the item
+                yield batch
+                batch = []
+                continue
+
+            task, next_item = next_item, None
+            try:
+                item = task.result()
+            except StopAsyncIteration:
+                break
+            if not batch and max_wait is not None:
+                deadline = loop.time() + max_wait
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        if next_item is not None:
+            next_item.cancel()
+
+
+def read_lines_mmap(file_path, start=0, end=None, batch_size=None, as_memoryview=False,
+                    encoding=None, block_size=1 << 20):
+    """Generator that memory-maps a file and yields its lines (without line endings).
+
+    Lines come back as bytes, decoded only if `encoding` is given. With
+    `as_memoryview=True` they are zero-copy views into the mapping (kept alive
+    while any view references it). `start`/`end` restrict reading to a byte
+    range (see `split_file_ranges`), and `batch_size` yields lists of lines.
+    """
+    if batch_size:
+        yield from batched(
+            read_lines_mmap(file_path, start, end, None, as_memoryview, encoding, block_size), batch_size
+        )
+        return
+
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if start >= end:
+            return
+
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if as_memoryview:
+                view = memoryview(mm)
+                pos = start
+                while pos < end:
+                    newline = mm.find(b"\n", pos, end)
+                    line_end = end if newline == -1 else newline
+                    stop = line_end - 1 if line_end > pos and mm[line_end - 1] == 13 else line_end
+                    yield view[pos:stop]
+                    pos = line_end + 1
+                return
+
+            pos = start
+            while pos < end:
+                # Slice a block, cut it at its last newline and split in C
+                block_end = min(pos + block_size, end)
+                newline = mm.rfind(b"\n", pos, block_end)
+                if newline == -1:
+                    newline = mm.find(b"\n", block_end, end)
+                cut = end if newline == -1 else newline
+                for line in mm[pos:cut].split(b"\n"):
+                    if line.endswith(b"\r"):
+                        line = line[:-1]
+                    yield line.decode(encoding) if encoding else line
+                pos = cut + 1
+        finally:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # Memoryviews still reference the mapping; it is unmapped once they are gone
+
+
+def split_file_ranges(file_path, parts):
+    """Splits a file into up to `parts` (start, end) byte ranges that begin at line starts."""
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            boundaries = [0]
+            for i in range(1, parts):
+                newline = mm.find(b"\n", max(size * i // parts, boundaries[-1]))
+                if newline == -1 or newline + 1 >= size:
+                    break
+                if newline + 1 > boundaries[-1]:
+                    boundaries.append(newline + 1)
+            boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def map_file_ranges(file_path, func, processes=None):
+    """Runs `func(file_path, start, end)` over newline-aligned ranges in a process pool.
+
+    `func` must be a module-level function (it is pickled to the workers) and
+    usually calls `read_lines_mmap(file_path, start, end)`. Results are returned
+    in file order.
+    """
+    processes = processes or os.cpu_count()
+    ranges = split_file_ranges(file_path, processes)
+    if len(ranges) <= 1:
+        return [func(file_path, start, end) for start, end in ranges]
+    with ProcessPoolExecutor(max_workers=min(processes, len(ranges))) as executor:
+        futures = [executor.submit(func, file_path, start, end) for start, end in ranges]
+        return [future.result() for future in futures]
+
+
+def _pooled_session(pool_size):
+    """Creates a requests.Session whose connection pool fits `pool_size` concurrent requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(pool_size, 1))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _fetch_page(session, api_url, page):
+    response = session.get(api_url, params={"page": page})
+    response.raise_for_status()  # A 429/500 error body is not a page of rows
+    return response.json()
+
+
+def fetch_paginated_data(api_url, max_pages=5, prefetch=0, session=None):
+    """Generator that fetches API data page by page.
+
+    With `prefetch=N`, up to N pages are requested ahead on worker threads while
+    rows are still yielded in page order. Pages are fetched over one pooled
+    session (pass your own to share it), and iteration stops at the first empty
+    page. `max_pages=None` means "until the first empty page". HTTP errors
+    (e.g. 429 or 500) raise `requests.HTTPError`.
+    """
+    own_session = session is None
+    if own_session:
+        session = _pooled_session(prefetch)
+
+    try:
+        if prefetch <= 0:
+            page = 1
+            while max_pages is None or page <= max_pages:
+                data = _fetch_page(session, api_url, page)
+
+                if not data:
+                    break  # Stop if no more data
+
+                for row in data:
+                    yield row["body"]  # ✅ Yield each page
+
+                page += 1  # Move to next page
+            return
+
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque()  # Futures for the next pages, in page order
+            next_page = 1
+            try:
+                while True:
+                    while len(pending) < prefetch and (max_pages is None or next_page <= max_pages):
+                        pending.append(executor.submit(_fetch_page, session, api_url, next_page))
+                        next_page += 1
+                    if not pending:
+                        break
+
+                    data = pending.popleft().result()
+                    if not data:
+                        break  # Stop if no more data
+
+                    for row in data:
+                        yield row["body"]
+            finally:
+                for future in pending:
+                    future.cancel()  # Don't wait for lookahead pages nobody will read
+    finally:
+        if own_session:
+            session.close()
+
+
+async def _fetch_page_async(session, api_url, page):
+    async with session.get(api_url, params={"page": page}) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def fetch_paginated_data_async(api_url, max_pages=5, prefetch=4, session=None):
+    """Async generator counterpart of `fetch_paginated_data` (keeps `prefetch` pages in flight)."""
+    own_session = session is None
+    if own_session:
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=max(prefetch, 1)))
+
+    pending = deque()
+    next_page = 1
+    try:
+        while True:
+            while len(pending) < max(prefetch, 1) and (max_pages is None or next_page <= max_pages):
+                pending.append(asyncio.ensure_future(_fetch_page_async(session, api_url, next_page)))
+                next_page += 1
+            if not pending:
+                break
+
+            data = await pending.popleft()
+            if not data:
+                break
+
+            for row in data:
+                yield row["body"]
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if own_session:
+            await session.close()
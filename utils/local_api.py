@@ -0,0 +1,189 @@
+import math
+import json
+import random
+import asyncio
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from aiohttp import web
+
+WORDS = (
+    "sunt aut facere repellat provident occaecati excepturi optio reprehenderit qui est esse dolor "
+    "ea molestias quasi exercitationem nesciunt magnam eum et iusto sequi sint nihil reprehenderit"
+).split()
+
+
+def _lognormal(rng, mean, sigma=0.5):
+    return rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)  # Shifted so the mean stays `mean`
+
+
+LATENCY_DISTRIBUTIONS = {
+    "fixed": lambda rng, mean: mean,
+    "uniform": lambda rng, mean: rng.uniform(0, 2 * mean),
+    "exponential": lambda rng, mean: rng.expovariate(1 / mean),
+    "lognormal": _lognormal,
+}
+
+
+class LocalAPIServer:
+    """Offline stand-in for jsonplaceholder's `/posts` and `/posts/{id}`, served by aiohttp on a background thread.
+
+    `/posts` returns every post, or one page with `?page=N` / `?_page=N`
+    (size from `per_page` / `_limit`, default `page_size`). Each request waits
+    a latency drawn from `latency_distribution` with mean `latency` seconds,
+    then fails with 429 (`throttle_rate`) or 500 (`error_rate`) at random.
+    Responses carry an ETag and answer `If-None-Match` with 304. Pass `seed`
+    for reproducible posts, latencies and failures. Use `port=0` (the default)
+    for an ephemeral port and read `base_url` after `start()`.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, posts: int = 100, page_size: int = 10,
+                 latency: float = 0.0, latency_distribution: str = "fixed", error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, body_size: int = 150, seed: int = None):
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution {latency_distribution!r}, "
+                             f"expected one of {sorted(LATENCY_DISTRIBUTIONS)}")
+        self.host = host
+        self.port = port
+        self.page_size = page_size
+        self.latency = latency
+        self.latency_distribution = latency_distribution
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rng = random.Random(seed)
+        self.posts = [self._make_post(post_id, body_size) for post_id in range(1, posts + 1)]
+        self.status_counts = Counter()  # Status code -> responses sent
+        self._loop = None
+        self._thread = None
+        self._error = None
+
+    def _make_post(self, post_id, body_size):
+        title = " ".join(self.rng.choices(WORDS, k=self.rng.randint(3, 8)))
+        body = " ".join(self.rng.choices(WORDS, k=body_size // 5 + 1))[:body_size]
+        return {"userId": (post_id - 1) // 10 + 1, "id": post_id, "title": title, "body": body}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    # 1. Request handling
+    def make_app(self) -> web.Application:
+        @web.middleware
+        async def inject_faults(request, handler):
+            response = await self._inject(request) or await handler(request)
+            self.status_counts[response.status] += 1
+            return response
+
+        app = web.Application(middlewares=[inject_faults])
+        app.router.add_get("/posts", self._list_posts)
+        app.router.add_get("/posts/{post_id}", self._get_post)
+        return app
+
+    async def _inject(self, _request):
+        if self.latency > 0:
+            await asyncio.sleep(LATENCY_DISTRIBUTIONS[self.latency_distribution](self.rng, self.latency))
+        roll = self.rng.random()
+        if roll < self.throttle_rate:
+            return web.json_response({"error": "Too Many Requests"}, status=429, headers={"Retry-After": "1"})
+        if roll < self.throttle_rate + self.error_rate:
+            return web.json_response({"error": "Internal Server Error"}, status=500)
+        return None
+
+    async def _list_posts(self, request):
+        query = request.query
+        page = query.get("_page") or query.get("page")
+        if page is None:
+            return self._json(request, self.posts)
+        try:
+            page = int(page)
+            limit = int(query.get("_limit") or query.get("per_page") or self.page_size)
+        except ValueError:
+            return web.json_response({"error": "page and limit must be integers"}, status=400)
+        start = (page - 1) * limit
+        return self._json(request, self.posts[max(start, 0): max(start + limit, 0)])
+
+    async def _get_post(self, request):
+        try:
+            post_id = int(request.match_info["post_id"])
+        except ValueError:
+            post_id = 0
+        if not 1 <= post_id <= len(self.posts):
+            return web.json_response({}, status=404)  # jsonplaceholder answers unknown ids with `{}`
+        return self._json(request, self.posts[post_id - 1])
+
+    @staticmethod
+    def _json(request, payload):
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+    # 2. Background-thread lifecycle
+    def start(self):
+        """Starts serving on a background thread and returns once the port is bound."""
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._serve, args=(started,), name="local-api", daemon=True)
+        self._thread.start()
+        started.wait()
+        if self._error is not None:
+            raise self._error
+        return self
+
+    def _serve(self, started):
+        asyncio.set_event_loop(self._loop)
+        runner = web.AppRunner(self.make_app(), access_log=None, shutdown_timeout=1.0)
+        try:
+            self._loop.run_until_complete(runner.setup())
+            self._loop.run_until_complete(web.TCPSite(runner, self.host, self.port).start())
+            self.port = runner.addresses[0][1]
+        except OSError as e:  # e.g. port already in use
+            self._error = e
+            started.set()
+            return
+        started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(runner.cleanup())
+            self._loop.close()
+
+    def stop(self):
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+# 3. CLI: python -m utils.local_api --port 8000 --latency 0.05 --latency-distribution lognormal
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a local jsonplaceholder-like /posts API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean latency per request, in seconds")
+    parser.add_argument("--latency-distribution", default="fixed", choices=sorted(LATENCY_DISTRIBUTIONS))
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--body-size", type=int, default=150)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = LocalAPIServer(
+        args.host, args.port, args.posts, args.page_size, args.latency, args.latency_distribution,
+        args.error_rate, args.throttle_rate, args.body_size, args.seed,
+    )
+    web.run_app(server.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
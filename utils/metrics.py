@@ -0,0 +1,138 @@
+import json
+import math
+import itertools
+import threading
+
+
+class LatencyHistogram:
+    """Streaming histogram with log-spaced buckets (bounded relative error per percentile)."""
+
+    def __init__(self, precision=0.01):
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self._buckets = {}
+
+    def record(self, value):
+        index = int(math.log(value) / self._log_base) if value >= 1 else -1
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def percentile(self, q):
+        """Returns the approximate value at quantile `q` (0-100), or None if empty."""
+        total = sum(self._buckets.values())
+        if not total:
+            return None
+        rank = max(1, math.ceil(total * q / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return 0.0 if index < 0 else math.exp((index + 0.5) * self._log_base)
+
+
+class TimingStats:
+    """Per-function timing aggregates, in nanoseconds."""
+
+    def __init__(self, precision=0.01):
+        self.precision = precision
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0  # Every call, sampled or not
+            self.count = 0  # Timed (sampled) calls
+            self.total_ns = 0
+            self.min_ns = None
+            self.max_ns = None
+            self.histogram = LatencyHistogram(self.precision)
+            self._ticks = itertools.count(1)
+
+    def tick(self):
+        """Counts a call without taking the lock; returns the call number (1-based)."""
+        self.calls = next(self._ticks)
+        return self.calls
+
+    def record(self, elapsed_ns):
+        with self._lock:
+            self.count += 1
+            self.total_ns += elapsed_ns
+            self.min_ns = elapsed_ns if self.min_ns is None else min(self.min_ns, elapsed_ns)
+            self.max_ns = elapsed_ns if self.max_ns is None else max(self.max_ns, elapsed_ns)
+            self.histogram.record(elapsed_ns)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "calls": max(self.calls, self.count),
+                "count": self.count,
+                "total_ns": self.total_ns,
+                "mean_ns": self.total_ns / self.count if self.count else None,
+                "min_ns": self.min_ns,
+                "max_ns": self.max_ns,
+                "p50_ns": self._percentile(50),
+                "p95_ns": self._percentile(95),
+                "p99_ns": self._percentile(99),
+            }
+
+    def _percentile(self, q):
+        value = self.histogram.percentile(q)
+        return None if value is None else min(max(value, self.min_ns), self.max_ns)
+
+
+class MetricsRegistry:
+    """In-process registry of timing stats, keyed by metric name."""
+
+    def __init__(self, precision=0.01):
+        self.precision = precision
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """Returns the stats for `name`, creating them on first use."""
+        stats = self._stats.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(name, TimingStats(self.precision))
+        return stats
+
+    def record(self, name, elapsed_ns):
+        self.get(name).record(elapsed_ns)
+
+    def reset(self):
+        """Zeroes every metric (decorated functions keep recording into the same stats)."""
+        with self._lock:
+            items = list(self._stats.values())
+        for stats in items:
+            stats.reset()
+
+    def snapshot(self):
+        """Returns {name: stats dict} for every recorded metric."""
+        with self._lock:
+            items = list(self._stats.items())
+        return {name: stats.snapshot() for name, stats in items}
+
+    def to_json(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_table(self):
+        """Renders the metrics as a fixed-width text table (times in milliseconds)."""
+        columns = ["calls", "count", "total", "mean", "p50", "p95", "p99", "max"]
+        snapshot = self.snapshot()
+        width = max([len("name")] + [len(name) for name in snapshot])
+        lines = [f"{'name':<{width}} " + " ".join(f"{column:>10}" for column in columns)]
+        for name, stats in sorted(snapshot.items()):
+            values = [
+                stats["calls"], stats["count"],
+                _ms(stats["total_ns"]), _ms(stats["mean_ns"]), _ms(stats["p50_ns"]),
+                _ms(stats["p95_ns"]), _ms(stats["p99_ns"]), _ms(stats["max_ns"]),
+            ]
+            lines.append(f"{name:<{width}} " + " ".join(f"{value:>10}" for value in values))
+        return "\n".join(lines)
+
+
+def _ms(value_ns):
+    return "-" if value_ns is None else f"{value_ns / 1e6:.3f}"
+
+
+# Default registry used by `utils.decorators.time_it`
+registry = MetricsRegistry()
@@ -0,0 +1,213 @@
+import os
+import atexit
+import pickle
+import threading
+import multiprocessing
+from functools import partial, reduce
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.pool import ThreadPool
+import numpy as np
+from utils.generators import batched
+
+BACKENDS = ("auto", "serial", "thread", "process")
+
+SHARED_MEMORY_MIN_BYTES = 1 << 20  # Smaller partial arrays are cheaper to pickle
+
+_pools = {}  # (backend, workers) -> warm Pool / ThreadPool, reused across calls
+_pools_lock = threading.Lock()
+
+
+def default_workers(backend: str) -> int:
+    cpus = os.cpu_count() or 1
+    return cpus if backend == "process" else min(32, cpus + 4)  # Same default as ThreadPoolExecutor
+
+
+def get_pool(backend: str, workers: int = None):
+    """Returns the warm pool for `(backend, workers)`, creating it on first use."""
+    workers = workers or default_workers(backend)
+    key = (backend, workers)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = multiprocessing.Pool(workers) if backend == "process" else ThreadPool(workers)
+            _pools[key] = pool
+    return pool
+
+
+def shutdown():
+    """Closes every warm pool and waits for its workers (registered with `atexit`)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+        pool.join()
+
+
+atexit.register(shutdown)
+
+
+def auto_chunksize(total: int, workers: int) -> int:
+    """About four chunks per worker, the same rule as `Pool.map`."""
+    chunksize, extra = divmod(total, workers * 4)
+    return max(1, chunksize + bool(extra))
+
+
+def _is_picklable(func) -> bool:
+    try:
+        pickle.dumps(func)
+        return True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+
+def choose_backend(func, total=None, workers=None) -> str:
+    """Picks a backend for CPU-bound work.
+
+    Serial when there is nothing to parallelize (fewer than two items or one
+    CPU), processes when `func` can be pickled (module-level functions), and
+    threads otherwise (lambdas, closures, bound methods of unpicklable objects).
+    """
+    if (total is not None and total < 2) or (workers or os.cpu_count() or 1) < 2:
+        return "serial"
+    return "process" if _is_picklable(func) else "thread"
+
+
+def _resolve(func, items, backend, workers):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    total = len(items) if hasattr(items, "__len__") else None
+    if backend == "auto":
+        backend = choose_backend(func, total, workers)
+    return backend, total
+
+
+def parallel_map(func, items, backend: str = "auto", workers: int = None, chunksize: int = None) -> list:
+    """Applies `func` to every item on a warm pool and returns the results in input order.
+
+    Pools are created lazily, kept per `(backend, workers)` and shut down at
+    exit, so repeated short batches don't pay process startup each time.
+    Functions sent to the process backend must be importable by the workers.
+    """
+    items = items if hasattr(items, "__len__") else list(items)
+    backend, total = _resolve(func, items, backend, workers)
+    if backend == "serial":
+        return [func(item) for item in items]
+
+    workers = workers or default_workers(backend)
+    return get_pool(backend, workers).map(func, items, chunksize or auto_chunksize(total, workers))
+
+
+def parallel_imap(func, items, backend: str = "auto", workers: int = None, chunksize: int = None,
+                  ordered: bool = True):
+    """Streaming `parallel_map`: yields results as chunks complete (in input order unless `ordered=False`).
+
+    `items` is consumed lazily, so it can be a generator; without a length the
+    chunksize defaults to 1, as in `Pool.imap`.
+    """
+    backend, total = _resolve(func, items, backend, workers)
+    if backend == "serial":
+        yield from map(func, items)
+        return
+
+    workers = workers or default_workers(backend)
+    chunksize = chunksize or (auto_chunksize(total, workers) if total is not None else 1)
+    pool = get_pool(backend, workers)
+    yield from (pool.imap if ordered else pool.imap_unordered)(func, items, chunksize)
+
+
+class SharedArray:
+    """A NumPy array a worker placed in shared memory; only this small handle is pickled.
+
+    The worker creates the block and hands ownership to the receiver, which
+    calls `load` once to copy the array out and free the block.
+    """
+
+    def __init__(self, array: np.ndarray):
+        self.shape = array.shape
+        self.dtype = array.dtype
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        view = np.ndarray(array.shape, array.dtype, buffer=shm.buf)
+        view[...] = array
+        del view  # Release the buffer before closing
+        self.name = shm.name
+        resource_tracker.unregister(shm._name, "shared_memory")  # The receiver unlinks it, not this process
+        shm.close()
+
+    def load(self) -> np.ndarray:
+        shm = shared_memory.SharedMemory(name=self.name)
+        try:
+            view = np.ndarray(self.shape, self.dtype, buffer=shm.buf)
+            array = view.copy()
+            del view
+        finally:
+            shm.close()
+            shm.unlink()
+        return array
+
+    def unlink(self):
+        """Frees the block without reading it (when the reduction failed before reaching it)."""
+        shm = shared_memory.SharedMemory(name=self.name)
+        shm.close()
+        shm.unlink()
+
+
+def _reduce_chunk(func, reducer, initial, chunk, shared=False):
+    """Maps and reduces one chunk inside a worker, returning only the partial aggregate."""
+    result = reduce(reducer, map(func, chunk), *initial)
+    if shared and isinstance(result, np.ndarray) and not result.dtype.hasobject \
+            and result.nbytes >= SHARED_MEMORY_MIN_BYTES:
+        return SharedArray(result)
+    return result
+
+
+def _load_partial(result):
+    return result.load() if isinstance(result, SharedArray) else result
+
+
+def _discard_partials(results):
+    """Consumes the rest of an `imap` iterator, unlinking shared partials nobody will load."""
+    while True:
+        try:
+            result = next(results)
+        except StopIteration:
+            return
+        except Exception:
+            continue  # That chunk failed as well, so it left no shared memory behind
+        if isinstance(result, SharedArray):
+            result.unlink()
+
+
+def parallel_map_reduce(func, items, reducer, *initial, combiner=None, backend: str = "auto", workers: int = None,
+                        chunksize: int = None):
+    """Computes `reduce(reducer, map(func, items), *initial)` with the reduction done inside the workers.
+
+    Each chunk is mapped and reduced where it runs, so only one partial per
+    chunk travels back instead of every result; partials are then folded with
+    `combiner` (defaults to `reducer`). With the process backend, large NumPy
+    partials come back through `multiprocessing.shared_memory` rather than
+    pickles. `initial` is applied once per chunk, so it should be the
+    reducer's identity (e.g. 0, or an array of zeros).
+    """
+    if len(initial) > 1:
+        raise TypeError("parallel_map_reduce expected at most one initial value")
+    items = items if hasattr(items, "__len__") else list(items)
+    if not len(items):
+        if not initial:
+            raise TypeError("parallel_map_reduce() of empty items with no initial value")
+        return initial[0]
+
+    task = partial(_reduce_chunk, func, reducer, initial)
+    backend, total = _resolve(task, items, backend, workers)
+    if backend == "serial":
+        return task(items)
+
+    workers = workers or default_workers(backend)
+    chunks = batched(items, chunksize or auto_chunksize(total, workers))
+    if backend == "process":
+        task = partial(task, shared=True)
+    results = get_pool(backend, workers).imap(task, chunks)
+    try:
+        return reduce(combiner or reducer, map(_load_partial, results))
+    finally:
+        _discard_partials(results)  # A failed chunk or combiner must not leak /dev/shm segments
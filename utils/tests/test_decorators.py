@@ -0,0 +1,264 @@
+import time
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from utils.decorators import CacheInfo, CircuitBreaker, RetryBudget, _backoff_delay, retry, time_it, ttl_cache
+from utils.metrics import MetricsRegistry
+
+
+class Flaky:
+    """Callable that raises `error` for the first `failures` calls, then returns "ok"."""
+
+    def __init__(self, failures, error=ValueError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+        self.__name__ = "flaky"
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error("boom")
+        return "ok"
+
+
+def test_backoff_grows_and_is_capped():
+    assert [_backoff_delay(attempt, 1, 2, 5, False) for attempt in range(4)] == [1, 2, 4, 5]
+
+
+def test_jitter_stays_within_the_backoff():
+    delays = [_backoff_delay(3, 1, 2, None, True) for _ in range(200)]
+
+    assert all(0 <= delay <= 8 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retries_until_success():
+    flaky = Flaky(failures=2)
+
+    assert retry(max_attempts=3, delay=0)(flaky)() == "ok"
+    assert flaky.calls == 3
+
+
+def test_gives_up_after_max_attempts():
+    flaky = Flaky(failures=5)
+
+    assert retry(max_attempts=3, delay=0)(flaky)() is None
+    assert flaky.calls == 3
+
+
+def test_reraise_raises_the_last_error_after_max_attempts():
+    flaky = Flaky(failures=5)
+
+    with pytest.raises(ValueError):
+        retry(max_attempts=3, delay=0, reraise=True)(flaky)()
+    assert flaky.calls == 3
+
+
+def test_only_listed_exceptions_are_retried():
+    flaky = Flaky(failures=1, error=KeyError)
+
+    with pytest.raises(KeyError):
+        retry(max_attempts=3, delay=0, exceptions=(ValueError,))(flaky)()
+    assert flaky.calls == 1
+
+
+def test_budget_exhaustion_stops_retries():
+    budget = RetryBudget(max_retries=1, per_seconds=60)
+    flaky = Flaky(failures=5)
+
+    assert retry(max_attempts=5, delay=0, budget=budget)(flaky)() is None
+    assert flaky.calls == 2  # The first attempt plus the single budgeted retry
+    assert not budget.try_spend()
+
+
+def test_breaker_opens_then_lets_a_single_probe_through():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    time.sleep(0.06)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # Others fail fast while the probe is in flight
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() and breaker.allow_request()
+
+
+def test_unretried_error_releases_the_half_open_probe():
+    """Test that a probe failing with an exception outside `exceptions` still reopens the breaker."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    flaky = Flaky(failures=1, error=KeyError)
+
+    with pytest.raises(KeyError):
+        retry(delay=0, exceptions=(ValueError,), circuit_breaker=breaker)(flaky)()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    time.sleep(0.06)
+    assert breaker.allow_request()  # A new probe is let through after reset_timeout, not 2 x reset_timeout
+
+
+def test_open_breaker_fails_fast_without_calling():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    flaky = Flaky(failures=0)
+
+    assert retry(circuit_breaker=breaker)(flaky)() is None
+    assert flaky.calls == 0
+
+
+def test_async_retry_does_not_block_the_event_loop():
+    calls = []
+
+    @retry(max_attempts=3, delay=0.05)
+    async def fetch(key):
+        calls.append(key)
+        if calls.count(key) < 3:
+            raise ValueError("boom")
+        return key
+
+    async def main():
+        start = time.perf_counter()
+        results = await asyncio.gather(*(fetch(key) for key in range(10)))
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(main())
+
+    assert results == list(range(10))
+    assert elapsed < 0.5  # Ten calls backing off 0.1s each overlap instead of taking 1s in sequence
+
+
+def test_ttl_cache_counts_hits_and_misses():
+    calls = []
+
+    @ttl_cache(maxsize=4)
+    def square(n, power=2):
+        calls.append(n)
+        return n ** power
+
+    assert [square(2), square(2), square(3), square(2, power=3)] == [4, 4, 9, 8]
+    assert calls == [2, 3, 2]
+    assert square.cache_info() == CacheInfo(hits=1, misses=3, evictions=0, maxsize=4, currsize=3)
+
+    square.cache_clear()
+    assert square.cache_info() == CacheInfo(0, 0, 0, 4, 0)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    calls = []
+
+    @ttl_cache(maxsize=2)
+    def identity(n):
+        calls.append(n)
+        return n
+
+    identity(1)
+    identity(2)
+    identity(1)  # 2 is now the least recently used
+    identity(3)
+    identity(1)
+    identity(2)
+
+    assert calls == [1, 2, 3, 2]
+    assert identity.cache_info().evictions == 2
+
+
+def test_ttl_cache_expires_entries():
+    calls = []
+
+    @ttl_cache(ttl=0.05)
+    def identity(n):
+        calls.append(n)
+        return n
+
+    identity(1)
+    identity(1)
+    time.sleep(0.06)
+    identity(1)
+
+    assert calls == [1, 1]
+
+
+def test_ttl_cache_coalesces_concurrent_misses():
+    calls = []
+    release = threading.Event()
+
+    @ttl_cache()
+    def slow(n):
+        calls.append(n)
+        release.wait(1)
+        return n * 10
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(slow, 7) for _ in range(8)]
+        time.sleep(0.05)  # Let every thread reach the cache before the value is ready
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [70] * 8
+    assert calls == [7]  # Computed once, the other seven waited for it
+
+
+def test_ttl_cache_shares_errors_without_caching_them():
+    calls = []
+
+    @ttl_cache()
+    def failing(n):
+        calls.append(n)
+        raise ValueError("boom")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            failing(1)
+    assert calls == [1, 1]
+
+
+def test_time_it_keys_metrics_by_module_and_qualname():
+    registry = MetricsRegistry()
+
+    @time_it(registry=registry)
+    def work():
+        return 1
+
+    work()
+
+    assert list(registry.snapshot()) == [f"{__name__}.test_time_it_keys_metrics_by_module_and_qualname.<locals>.work"]
+
+
+def test_time_it_samples_every_nth_call():
+    registry = MetricsRegistry()
+
+    @time_it(name="sampled", sample_every=4, registry=registry)
+    def work(n):
+        return n
+
+    assert [work(n) for n in range(10)] == list(range(10))
+    stats = registry.snapshot()["sampled"]
+    assert (stats["calls"], stats["count"]) == (10, 2)  # Calls 4 and 8 were timed
+
+
+def test_time_it_wraps_coroutines():
+    registry = MetricsRegistry()
+
+    @time_it(name="async", registry=registry)
+    async def work():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    assert inspect.iscoroutinefunction(work)
+    assert asyncio.run(work()) == "done"
+    assert registry.snapshot()["async"]["min_ns"] >= 10_000_000  # Awaited time is included
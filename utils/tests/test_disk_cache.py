@@ -0,0 +1,44 @@
+import os
+from utils.disk_cache import DiskLRU
+
+
+def test_write_is_atomic_and_leaves_no_temp_files(tmp_path):
+    store = DiskLRU([str(tmp_path)], max_bytes=1024)
+    path = os.path.join(tmp_path, "entry.cache")
+
+    store.write(path, b"first")
+    store.write(path, b"second")
+
+    with open(path, "rb") as file:
+        assert file.read() == b"second"
+    assert os.listdir(tmp_path) == ["entry.cache"]
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    """Test that eviction follows mtime order, so a touched entry survives."""
+    store = DiskLRU([str(tmp_path)], max_bytes=250, suffix=".cache")
+    paths = [os.path.join(tmp_path, f"{i}.cache") for i in range(3)]
+    for i, path in enumerate(paths):
+        store.write(path, b"x" * 100)
+        os.utime(path, (i, i))
+    store.write(os.path.join(tmp_path, "ignored.txt"), b"y" * 1000)  # Not an entry
+    os.utime(paths[0], (10, 10))  # paths[0] becomes the most recently used
+
+    store.evict()
+
+    assert sorted(os.listdir(tmp_path)) == ["0.cache", "2.cache", "ignored.txt"]
+    assert store.stats().evictions == 1
+    assert store.stats().currsize_bytes == 200
+
+
+def test_counters_and_clear(tmp_path):
+    store = DiskLRU([str(tmp_path / "a"), str(tmp_path / "b")], max_bytes=1024)
+    store.write(str(tmp_path / "a" / "1"), b"1")
+    store.write(str(tmp_path / "b" / "2"), b"22")
+    store.record_hit()
+    store.record_miss()
+    store.record_miss()
+
+    assert store.stats() == (1, 2, 0, 3, 1024)
+    store.clear()
+    assert store.stats().currsize_bytes == 0
@@ -0,0 +1,89 @@
+import time
+import random
+import asyncio
+import threading
+import pytest
+import requests
+from utils.fetch_engine import FetchEngine
+
+
+class ConcurrencyProbe:
+    """Sleeps a little per key and records the peak number of overlapping calls."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, key, timeout=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(random.uniform(0, 0.005))
+        with self.lock:
+            self.active -= 1
+        if key == 13:
+            raise ValueError("unlucky")
+        return key * 2
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_thread_backend_bounds_concurrency(ordered):
+    probe = ConcurrencyProbe()
+    engine = FetchEngine(concurrency=4, ordered=ordered)
+
+    results = list(engine.stream(probe, range(100)))
+
+    assert probe.peak <= 4
+    assert sorted(result.index for result in results) == list(range(100))
+    if ordered:
+        assert [result.key for result in results] == list(range(100))
+    assert [result.value for result in results if result.key == 7] == [14]
+    assert engine.stats.total == 100 and engine.stats.errors == 1
+    assert "ValueError: unlucky" in next(result.error for result in results if not result.ok)
+
+
+def test_thread_backend_pulls_keys_lazily():
+    pulled = []
+
+    def keys():
+        for key in range(1000):
+            pulled.append(key)
+            yield key
+
+    stream = FetchEngine(concurrency=2, max_pending=4).stream(lambda key, timeout=None: key, keys())
+    next(stream)
+    stream.close()
+
+    assert len(pulled) <= 5  # The window, not the whole iterable
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_asyncio_backend_bounds_concurrency_and_times_out(ordered):
+    state = {"active": 0, "peak": 0}
+
+    async def fetch(key):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(60 if key == 5 else random.uniform(0, 0.005))
+            return key
+        finally:
+            state["active"] -= 1
+
+    engine = FetchEngine(concurrency=8, timeout=0.5, ordered=ordered)  # Generous, so only key 5 times out
+    results = asyncio.run(engine.afetch_all(fetch, range(200)))
+
+    assert state["peak"] <= 8
+    assert [result.key for result in results] == list(range(200))
+    assert not results[5].ok and results[5].error.startswith("TimeoutError")
+    assert engine.stats.ok == 199 and engine.stats.throughput > 0
+
+
+def test_fetches_posts_from_local_api(local_api):
+    def fetch(post_id, timeout=None):
+        return requests.get(f"{local_api.base_url}/posts/{post_id}", timeout=timeout).json()
+
+    results = FetchEngine(concurrency=8, ordered=True).stream(fetch, range(1, 101))
+
+    assert [result.value["id"] for result in results] == list(range(1, 101))
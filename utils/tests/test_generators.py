@@ -0,0 +1,147 @@
+import asyncio
+import aiohttp
+import numpy as np
+import pytest
+import requests
+from utils.generators import (
+    abatched, batched, fetch_paginated_data, fetch_paginated_data_async, map_file_ranges, read_lines_mmap,
+    split_file_ranges,
+)
+from utils.local_api import LocalAPIServer
+
+
+@pytest.fixture(scope="module")
+def small_api():
+    """25 posts in pages of 10, so the fourth page is the first empty one."""
+    with LocalAPIServer(posts=25, page_size=10, seed=0) as server:
+        yield server
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+def test_pages_are_yielded_in_order_until_the_first_empty_page(small_api, prefetch):
+    bodies = list(fetch_paginated_data(f"{small_api.base_url}/posts", max_pages=None, prefetch=prefetch))
+
+    assert bodies == [post["body"] for post in small_api.posts]
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_max_pages_limits_the_fetch(small_api, prefetch):
+    bodies = list(fetch_paginated_data(f"{small_api.base_url}/posts", max_pages=2, prefetch=prefetch))
+
+    assert bodies == [post["body"] for post in small_api.posts[:20]]
+
+
+def test_consumer_can_stop_early(small_api):
+    rows = fetch_paginated_data(f"{small_api.base_url}/posts", max_pages=None, prefetch=3)
+
+    first = [next(rows) for _ in range(3)]
+    rows.close()  # Cancels the lookahead pages and closes the owned session
+
+    assert first == [post["body"] for post in small_api.posts[:3]]
+
+
+def test_async_generator_matches_sync(small_api):
+    async def collect(prefetch):
+        return [row async for row in fetch_paginated_data_async(f"{small_api.base_url}/posts", None, prefetch)]
+
+    expected = [post["body"] for post in small_api.posts]
+    assert asyncio.run(collect(1)) == expected
+    assert asyncio.run(collect(4)) == expected
+
+
+def test_http_errors_raise_instead_of_yielding_error_bodies():
+    with LocalAPIServer(throttle_rate=1.0) as server:
+        with pytest.raises(requests.HTTPError):
+            list(fetch_paginated_data(f"{server.base_url}/posts", prefetch=2))
+
+        async def collect():
+            return [row async for row in fetch_paginated_data_async(f"{server.base_url}/posts")]
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(collect())
+
+
+def test_batched_groups_any_iterable():
+    assert list(batched(iter(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    with pytest.raises(ValueError):
+        list(batched([1], 0))
+
+
+def test_batched_slices_arrays_and_bytes_without_copying():
+    array = np.arange(10)
+    data = b"abcdefgh"
+
+    array_batches = list(batched(array, 4))
+    byte_batches = list(batched(data, 3))
+
+    assert all(np.shares_memory(batch, array) for batch in array_batches)
+    assert [batch.tolist() for batch in array_batches] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert all(isinstance(batch, memoryview) and batch.obj is data for batch in byte_batches)
+    assert [bytes(batch) for batch in byte_batches] == [b"abc", b"def", b"gh"]
+
+
+def test_abatched_flushes_partial_batches_after_max_wait():
+    async def items():
+        yield 0
+        yield 1
+        await asyncio.sleep(0.2)  # A slow producer: the open batch must not wait for it
+        yield 2
+
+    async def collect():
+        return [batch async for batch in abatched(items(), batch_size=10, max_wait=0.05)]
+
+    assert asyncio.run(collect()) == [[0, 1], [2]]
+
+
+def test_abatched_accepts_sync_iterables():
+    async def collect():
+        return [batch async for batch in abatched(range(5), batch_size=2)]
+
+    assert asyncio.run(collect()) == [[0, 1], [2, 3], [4]]
+
+
+def count_lines(file_path, start, end):
+    return sum(1 for _ in read_lines_mmap(file_path, start, end))
+
+
+@pytest.fixture
+def crlf_file(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"alpha\r\nbeta\n\ngamma\r\ndelta")  # Mixed endings, blank line, no trailing newline
+    return str(path)
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 1 << 20])
+def test_read_lines_mmap_handles_crlf_and_missing_final_newline(crlf_file, block_size):
+    expected = [b"alpha", b"beta", b"", b"gamma", b"delta"]
+
+    assert list(read_lines_mmap(crlf_file, block_size=block_size)) == expected
+    assert [bytes(line) for line in read_lines_mmap(crlf_file, as_memoryview=True)] == expected
+    assert list(read_lines_mmap(crlf_file, encoding="utf-8", batch_size=2)) == [
+        ["alpha", "beta"], ["", "gamma"], ["delta"],
+    ]
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 50])
+def test_split_file_ranges_cover_every_line_exactly_once(tmp_path, parts):
+    rng = np.random.default_rng(parts)
+    lines = [b"x" * int(length) for length in rng.integers(0, 40, 200)]
+    data = b"\n".join(lines) + b"\n"
+    path = tmp_path / "data.txt"
+    path.write_bytes(data)
+
+    ranges = split_file_ranges(str(path), parts)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    assert all(data[start - 1: start] == b"\n" for start, _ in ranges[1:])  # Every range starts a line
+    assert [line for start, end in ranges for line in read_lines_mmap(str(path), start, end)] == lines
+    assert sum(map_file_ranges(str(path), count_lines, processes=parts)) == len(lines)
+
+
+def test_split_file_ranges_of_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert split_file_ranges(str(path), 4) == []
+    assert list(read_lines_mmap(str(path))) == []
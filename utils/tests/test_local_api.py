@@ -0,0 +1,83 @@
+import time
+import asyncio
+from functools import partial
+import aiohttp
+import requests
+import pytest
+from concurrency_examples.comparisons import io_bound
+from dependency_injection.api_client import APIClient
+from dependency_injection.http_cache import ResponseCache
+from utils.fetch_engine import FetchEngine
+from utils.generators import fetch_paginated_data
+from utils.local_api import LocalAPIServer
+
+
+def test_posts_shapes_and_pagination(local_api):
+    posts = requests.get(f"{local_api.base_url}/posts").json()
+    page = requests.get(f"{local_api.base_url}/posts", params={"_page": 2, "_limit": 5}).json()
+
+    assert len(posts) == 100
+    assert set(posts[0]) == {"userId", "id", "title", "body"}
+    assert page == posts[5:10]
+    assert requests.get(f"{local_api.base_url}/posts/7").json() == posts[6]
+    assert requests.get(f"{local_api.base_url}/posts/101").status_code == 404
+
+
+def test_paginated_generator_stops_at_last_page(local_api):
+    bodies = list(fetch_paginated_data(f"{local_api.base_url}/posts", max_pages=None, prefetch=3))
+
+    assert len(bodies) == 100
+
+
+def test_etag_revalidation_with_cached_client(local_api, tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    client = APIClient(url=f"{local_api.base_url}/posts", cache=cache)
+    not_modified = local_api.status_counts[304]
+
+    assert client.fetch_data() == client.fetch_data()
+    assert local_api.status_counts[304] == not_modified + 1
+    assert cache.stats().hits == 1
+
+
+def test_io_examples_accept_base_url(local_api):
+    assert io_bound.run_asyncio(local_api.base_url) == io_bound.run_single_thread(local_api.base_url)
+
+
+def test_io_fetchers_report_server_errors():
+    """Test that injected 500s become failed results (after retries) instead of error bodies."""
+    engine = FetchEngine(concurrency=4, ordered=True)
+
+    async def fetch_async(base_url):
+        async with aiohttp.ClientSession() as session:
+            fetch = partial(io_bound.fetch_post_async, session, base_url=base_url)
+            return [result async for result in engine.astream(fetch, [1, 2])]
+
+    with LocalAPIServer(error_rate=1.0, seed=0) as server:
+        results = list(engine.stream(partial(io_bound.fetch_post, base_url=server.base_url), [1, 2, 3]))
+        assert engine.stats.errors == 3 and engine.stats.ok == 0
+        assert all(result.error.startswith("HTTPError") for result in results)
+
+        results = asyncio.run(fetch_async(server.base_url))
+        assert engine.stats.errors == 2 and engine.stats.ok == 0
+        assert all(result.error.startswith("ClientResponseError") for result in results)
+        assert server.status_counts[500] == 3 + 2 * 3  # Each async fetch was attempted three times
+
+
+def test_fault_injection():
+    with LocalAPIServer(throttle_rate=0.5, error_rate=0.5, seed=1) as server:
+        statuses = {requests.get(f"{server.base_url}/posts/1").status_code for _ in range(20)}
+
+    assert statuses == {429, 500}
+
+
+def test_latency_injection():
+    with LocalAPIServer(latency=0.05, seed=1) as server:
+        start = time.perf_counter()
+        requests.get(f"{server.base_url}/posts/1")
+
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_unknown_latency_distribution():
+    with pytest.raises(ValueError):
+        LocalAPIServer(latency_distribution="pareto")
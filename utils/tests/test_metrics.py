@@ -0,0 +1,59 @@
+import json
+import random
+import pytest
+from utils.metrics import LatencyHistogram, MetricsRegistry
+
+
+def test_histogram_percentiles_within_precision():
+    rng = random.Random(0)
+    values = sorted(rng.lognormvariate(13, 1) for _ in range(10_000))  # ~ms-scale latencies in ns
+    histogram = LatencyHistogram(precision=0.01)
+    for value in values:
+        histogram.record(value)
+
+    for q in (50, 95, 99):
+        exact = values[int(len(values) * q / 100) - 1]
+        assert histogram.percentile(q) == pytest.approx(exact, rel=0.02)
+
+
+def test_histogram_empty_and_sub_unit_values():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+
+    histogram.record(0)
+    assert histogram.percentile(50) == 0.0
+
+
+def test_registry_snapshot_clamps_percentiles_to_observed_range():
+    registry = MetricsRegistry()
+    for elapsed_ns in (1_000, 2_000, 3_000):
+        registry.record("op", elapsed_ns)
+
+    stats = registry.snapshot()["op"]
+
+    assert (stats["count"], stats["total_ns"], stats["mean_ns"]) == (3, 6_000, 2_000)
+    assert (stats["min_ns"], stats["max_ns"]) == (1_000, 3_000)
+    assert 1_000 <= stats["p50_ns"] <= stats["p95_ns"] <= stats["p99_ns"] <= 3_000
+    assert stats["p50_ns"] == pytest.approx(2_000, rel=0.01)
+
+
+def test_registry_reset_keeps_stats_objects():
+    registry = MetricsRegistry()
+    stats = registry.get("op")
+    stats.record(5)
+
+    registry.reset()
+    stats.record(7)
+
+    assert registry.get("op") is stats
+    assert registry.snapshot()["op"]["count"] == 1
+
+
+def test_registry_exports():
+    registry = MetricsRegistry()
+    registry.record("module.fast", 1_500_000)
+
+    assert json.loads(registry.to_json())["module.fast"]["count"] == 1
+    header, row = registry.to_table().splitlines()
+    assert header.split()[:2] == ["name", "calls"]
+    assert row.split()[0] == "module.fast" and "1.500" in row
@@ -0,0 +1,106 @@
+import os
+import math
+import operator
+import numpy as np
+import pytest
+from utils import parallel
+from utils.parallel import auto_chunksize, choose_backend, parallel_imap, parallel_map, parallel_map_reduce
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process", "auto"])
+def test_parallel_map_preserves_order(backend):
+    items = list(range(50))
+
+    assert parallel_map(math.factorial, items, backend=backend, workers=2) == [math.factorial(n) for n in items]
+
+
+def test_pools_are_reused():
+    parallel_map(abs, range(10), backend="thread", workers=3)
+    pool = parallel.get_pool("thread", 3)
+    parallel_map(abs, range(10), backend="thread", workers=3)
+
+    assert parallel.get_pool("thread", 3) is pool
+
+
+def test_imap_streams_generators():
+    squares = parallel_imap(lambda n: n * n, (n for n in range(20)), backend="thread", workers=4, ordered=False)
+
+    assert sorted(squares) == [n * n for n in range(20)]
+
+
+def test_auto_backend_selection():
+    assert choose_backend(math.factorial, total=1, workers=4) == "serial"
+    assert choose_backend(math.factorial, total=100, workers=4) == "process"
+    assert choose_backend(lambda n: n, total=100, workers=4) == "thread"  # Lambdas can't be pickled
+
+
+def test_auto_chunksize_matches_pool_map():
+    assert auto_chunksize(100, 4) == 7  # ceil(100 / 16)
+    assert auto_chunksize(3, 4) == 1
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        parallel_map(abs, [1], backend="gpu")
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_map_reduce_matches_reduce(backend):
+    result = parallel_map_reduce(math.factorial, range(1, 200), operator.add, 0, backend=backend, workers=2)
+
+    assert result == sum(math.factorial(n) for n in range(1, 200))
+
+
+def histogram(seed):
+    return np.bincount(np.random.default_rng(seed).integers(0, 300_000, 1000), minlength=300_000)
+
+
+def test_map_reduce_returns_large_arrays_through_shared_memory(monkeypatch):
+    loaded = []
+    original_load = parallel.SharedArray.load
+
+    def counting_load(self):
+        loaded.append(self.name)
+        return original_load(self)
+
+    monkeypatch.setattr(parallel.SharedArray, "load", counting_load)
+
+    result = parallel_map_reduce(histogram, range(8), np.add, backend="process", workers=2, chunksize=2)
+
+    assert np.array_equal(result, sum(histogram(seed) for seed in range(8)))
+    assert len(loaded) == 4  # One 2.4 MB partial per chunk
+
+
+def histogram_or_fail(seed):
+    if seed == 0:
+        raise ValueError("bad chunk")
+    return histogram(seed)
+
+
+def shared_segments():
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+def fail_to_combine(left, right):
+    raise RuntimeError("combiner failed")
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs POSIX shared memory in /dev/shm")
+@pytest.mark.parametrize("func, combiner, error", [
+    (histogram_or_fail, None, ValueError),
+    (histogram, fail_to_combine, RuntimeError),
+])
+def test_map_reduce_frees_shared_memory_on_error(func, combiner, error):
+    """Test that partials returned after a failure are unlinked rather than left in /dev/shm."""
+    before = shared_segments()
+
+    with pytest.raises(error):
+        parallel_map_reduce(func, range(8), np.add, combiner=combiner, backend="process", workers=2, chunksize=2)
+
+    assert shared_segments() - before == set()
+
+
+def test_map_reduce_empty_items():
+    assert parallel_map_reduce(abs, [], operator.add, 0) == 0
+    with pytest.raises(TypeError):
+        parallel_map_reduce(abs, [], operator.add)